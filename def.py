@@ -1,10 +1,8 @@
-import struct
+import numpy as np
 
 def hex_to_arr(hex_string): 
-    # Convert hex string to bytes
-    byte_array = bytes.fromhex(hex_string)
-    # Unpack bytes into a list of floats
-    return list(struct.unpack('f' * (len(byte_array) // 4), byte_array))
+    # Convert hex string to bytes and view them as float32 in one step
+    return np.frombuffer(bytes.fromhex(hex_string), dtype=np.float32)
 
 # Example usage
 hex_input = "e710b0bfcf60ee3e3adbca40cf30bcbff7e4e53eb5f768bf959a98bf8779d53f6b7ca53f8a0a87c0b080bdbf7a6a1ac0d9c31940bd35dfbd6bbc233fada9a4c06aa9564001f7b7c039043cc03b619340f0c35dbfb8475bbec5d31cbf898d6fbed266873c8b5b403ed74101c00a087bc0a70dba3dcec64e40432d87bf105042bf31e09abfe8ada23f904200c0a255243f7aae56bf9ac29a3f75a931406ba1d7bf38345bbd7af80e4079744c3fb568a7bf0d3e964077b7b9c0c9f597bf0a63bfbf78cf8cc0bf7631402d2686be395422bd27a157c05125364077bb3b406953dbbf86581b40da848ec0fd70913fb503d73e40e010c0311021c02b1683c02f084bbf8d0c7f3fc71f0dc0ff79e4bf48db3f40b6353ac0c86e5abfd07f1e4080f86cbfaa9910be91d366c07f7adcbfe98ef9bf832089bf119020bf0bb648c03b88e0be92810e3fe893b5bf4e653a3fbb81a63f571303c08674d1bfb518823c880a6dbf2be7e0bd2f3cf93f2bb8df3fdbee483e759664bb50e61940158a683eb80f313ff560874071f1a03e28be333f59a7733f4e2f2340009dbdbf9094983e5b2153bc5f3880bf976ba8beeb2a82bf72c984c042251abfaf882440394a3c40071028c064990a3f4b9c2e406df8cbc064ec8ec0964f75c0074c8b3f6537dc3f595c1a3fb9e15640f9af63beb90082bd7b9447bf58de693ff9ab2dbe892aafc0ef4900c02d28e33e96448240adfe4040c62409c0bfda783f9b041d405bc494bf86a222be46185040e3064c3fcb99973fd2396740f523263eb21ca13e289a1bc0f07891c0ae30c2bfc5ab2440a2ce6d40a9751e4022501f401111adbf83bfa3c0ab41f43f3fe1bcbf5e8fcfbf52eae0bf290b444031798abdcdc2a9bf3d9a003fb7499e409759c4bf925ba9bfaaa58c40aafe3840c9eeae3f43a6a1c0e64c8f400e0d41c04f05863e5beb3fc0ede1d63e904b2dc0ab711d3fb7dffc3e0299983e29a8f83ead7a0b3f1e99c73f629433c0a5492c3fc2f2b23f0aba8340b89384c0a9d198bf802db2be6e30773fab56173e19251fc0221b48c02ecf13c07ec0803f13ab69c0b617b5bf49a154c023098040cd3d29c025b9c5bcea9932c0d7db77400a35743e3ae03ebd561f5fbf80be95c0c66b5d4029d5373ff3a61640a8fe42400a318fc0179523c09ec134c0f2d29f4081a571bf91882abe271f94bf639bc0bf2efe9dbf392203c0730a1fbfdb716d40790612bfcb478640790514bf6ad3ebbf38622340d00640bf2576b73df2f5633f50b9673f2ef6e13f5e7df4be4e03c63d8f98d4bfa15c9a3fe8834e408de6073fe09d714093acbbc0f181ee3fd7c4933f48cb4bbe92fc8d3fe00019c03bca41c0b1cb1f409ff81cc056c298c072ce82bed59c9ebe0b13984040ec2f4048af4fc0074672bf50b4abbec71678403ab0a73ff908ba3e707b793fe7b0a43ea365794013c8d23e6bc7db3c897a8f3fb7d5b9c0691540c0382d223f6a7c9cc0a988f5bf5be8304077b983bf014e29409d09e2be6053aabee7803bbf8857bc3ec298ddbf103bdb3f53c12c3f3e0c04c02ea72e3eb7558abffec92e40e0b4c23db9605fbfb4fd0b40d708cebfb5b44840889c78406526acbfe1360fc0c6f6b44008a3b8409acd783f834f8140fe58f7bf901f3240a0aa6f3ff5bc9d3f5046dbbfa99a6b405f03f5bfd3e362404704e9bf6f853ec073e751c090d7923f893d1140ea9b04bf59a519405a1d52bf2a0ab1c009b409becfc73840525b89bf7d9d88bf45e258c03d49f5bea171903e0ede81bf055ba0bf5be60bbff3800440622868bf331b853f6985ce3e9d4f3740fa89014075965a4039ba314054ca10c0e40a0d404b4e3fc0e131f4bf2a35d0bf9eb9d4bfc87876bffbef7e3ea972db3f562238c0f9e21c3fc3cd41bf8a57f8bf285442bec8b92c40966028c0ce9ccbc0a0ed5b40732a993fda65a640e0a507408d9005406235023f49544bc05980ee3f1e56d93fbb459c3f229e0e4075a2083f56b22c3fce09993e024f913feb69623f470ed63f995e55c0a5a440c02af88c40e8849d407f77933f7a7fc03f8e4b78c055431740ee58cdbf42a08140ac6101c0c524403feb5c833f4b77353f03356140ad83a2bfa5a0a7c0458dae3eff6f82bfcb24df3fd2592f3fd74c4d3f816c93bfc7339f402b9a71404170e7bfab9d8ec01efc31c0ce4957c0751809c0ae87a83fa32c13c0abb7e53f63a5673feb2487bf8389a840c79acb40aaeaa7bfb037b53ff3a874409e5aa53ff916a7be0e85e63f49a6403dc7814e40762f12bfa2d801c001de72c03e5aa73ea01e39407283b040de326f407ef89b401bc018c0d8b3ad3f89bdec4082282840b6a4b53f0768f3bf32cab1bf33cc2ec0ced49c40d3fa3cc09eea653f89f4aa401dd04cbf648f91bef92ac43fe0b3a2bf460033c053da3e40a384c3be798a0e40a78a893f1083c4c0dfc476403a0288bf02ad45be5127b240b22afdbf2b520ec0fb137240807a14bf62884940b13fbdbfe7c9164022ec20bf9f49683fe29429408613d3bf4b83e0bdd2ebaebfd5e8c03fda7cffbfaa1286404273d0bff5aeb33fe5cf1abf9874a0bfebeb643e8209d23fe0e5093f09f75cbecd4e06bf9fefb23d21ac6bbf43de0c40976e12c0d30089c081d5b6bf929b8dc0b1ec7bbf7de399c0d047a53f055110c0f6361740adbd77bfb122874035de973fff9e90bf1b1ec4bf526e69405d7833bfae19763fd12c2c406ae803c0bb68e43ff054d33ef2aab0bf089caa3fd20fedbf6dfa194056f3913fc5cb213f8bcf24c0512f6abfc684b43feb9d44bd118f3e3fd9b3a73d5e03323f36bfeb3f9b67f5becdde5a3f228dc93f704a74bf0b77653f58add03f0ecf85c09d4d08c042729bc0313112c0275976c0285a954043dbb0c05fd20540d1817240cdd1a13f29279f3f5058d23f60230f40c093843f2f4bfd3f7e81e3bf6507adbe9006bebcb383fe3f03c39d4069c3de3f9b4b86c0e53034c0065a893f4b37bdbdfd246240c57eb53e9553b83faf3bc63f0134abbf72c11dbf8fe02dc09d69f4bf2a91c140624e13c0861528bf98aad8c0487873bf59b5233fb963b03fb7335c3f7ddab3bf4db1debdedf8acbdf1a94240456b16be6e20773f953828c025f8acbfd792754046d8c9bdf55b923f5aff9b3f35e826c089f216bfdb7b91bf7a5d8bbf07580540ea8a983f08c9713fe5ae3240227acabfc0448640a0075bc07dbd164084f40040a6de50c0a80b8abd5ab6474021a4814049b24bbecb13e83c59cff1bf2b4ec53f63843ec0bb5784bd578e85c058a0f2bfbe4018bf974793bfd74379be7b0ed3c06ef66ebffdf95b40e36510bf9872d14065c89a3fe32004c073e8a2c05fdf0c40055ecbc0a741913f2ce986be619eb53f303477bd6f6fd33e3a6fcec08d4d72bf18c8173fae60a7bf8b58cc3fdec90e40a212a43f0137a73e635a0f40fe35474037ed5b40a9ea933f47e0a1bf76d839406e631f3fde0616c005093dc01f19acbfa54f943ee8e8f3beb38f92c0ebcebdbcc04f203e8981a43f41946fc09904a33f8b6c1240d34f85406143cf3f216f873d57b142c0a72d5d403295da3f6b31333fcfc849bfdfd601c0a98affbf8d73b73f2a6f9640e807083f9b39af3fae3fda3e0095a0bfdef2b4bfe9b9be3fffe955c0a0a400bd46f5fbbe9ad2094059bd78c06a3875407c6b02c0b9a3723f21fd3a4061b0993eaf390f4055b87640de0db93ff0e54940bfff90bd0ebd393fa95f30406b45e63fd5193040e9251c3f6e74e93f3b492ec0f97c493f3737a3c0691d224059666fbf47cd9dbf6797c63f187945404d3d05c015b494bfa23efcbe2528c340beeea33f4fdd31bff34337c0a86c1ec0627e3e3f99d91e40491ff5bf93fc18c0f01b65be8e5730405e9b363dde130b3fc0e6784081ca81c05587afc02559483f1abf8ac093be72c031c18a3f62f125c0a18e4bbfb3e349c0c5ea0cc081d2ddbf0596013f6ed8a03fead1adbf3de064be5eeb0ec083d5eabf0230a63f89a93b402d3ec33f47f93dc03b4a0abf3505994099d3b8bec289cf404a1b8340208447bf1019383e25c515c0896683bf82e361bf488aaebf61daedbfb8a0c9409228a1c03067acc080d23dc0938aa03e26ea3940c72e9740cf60cc3e4a25ebbfa31122405afcabbf8aa2c53f8e94b0bf42e97340227bda3fe7a5834095898e401ed9e4bf7b651d3fbb28eebe7d2ef23e718bb3bf94fe06bf478e8c3fe7a5673ec0b0d93f0d4815c01d6dda3fc1dd5d40dfb1d93ffb6a82c03d76403fc7243fbf77ff1cc07337a9be026d24c0f9af5140b0f60bc061f3d9bf4bada9bf78ce893f71bcc7bf3ea1d2405842b14083dc6540998cf83f0e6809c04035da3b32f9d1bf66a87fc047c029c026ce323ef536b1bf31ac473f219a8240ddc0c7bf2e0de63db0a6823ce8ff9e3e632a2d402a72494007648e40e0ffe83e99c18bc0890bc840d60260bd6274a5bf7fd20ac09eb599bf67a889bf7222393f757307be4ad2d53f92598540d02fd3bf1bbeedbde7509a4018983b3f59f544bff5acc63f872006bfb23c8abec52ad9bf4694a4bf284d494086aae0bfe94b74c0c33b673f838924c0796168be20c778c0e1797840ddb6c5bd2bf8213fe87060bf3f48063c6beee0bf7f3247bfa19c7ec06bb296c02f5798bf20d017c03af8ee3f17a3a8c04bbe5ebf8b20b5bf73c610c0e1b339c0c538513e07f1c4bed9d6a0402f7237bee97494c0b7dd90bfa9e49dbebefb3ac02179f73f0560153dbf7484401e08d64080138b3f69329ac0d9e3f2bfbd15ad40933e903fd054593d6343ed3f5fbe3cbfd55b5d3f88e2e7bf5edff0bf5ed01c3f1f8b4dbff8add63dc994a23e4300a5bde7a495c0f9c52dc09b4c41bf89d52bc05362f43f00ae5ac0e2cebe3f36c03fc09aa673be725a2ac02f2c124076f525c0ab3c0dc0894c0d40ed287abe0b6edcbf986e13c046ecdc3f3bfe323f89f9b8bf4cd783be6b4c8bbf0b89123fdfe311bfb85541bfa2b86bc0b156ce3f915fa9bf12c316c04585cd3f294290bf102826400861bfbf0258e83d5b7dc63f36f54440a5e4b63f45bb9b4086d3294085365ebea543823ef930993fb5077340d5976f3e162114bec029c73dde0d963e0d811040a17ddebf0d0887bfb93ca7c0d784c3bf00b6f33fc7db4ebf5943ec3ece2fd3c0086e1e40d541b8be0f2a7abfd91541409ea45a3f630f6e3e012a44c022cb5ec007712a40c95808c0fef8ef3f67a7bd407f4bfb3f7205b83f555258bf55393cc001a50fc0aeec64c0549a00c012852f3ffb0d90bf381587c013985fc0598dd43e7eb52040f281b8c022491ec0361790bf73c87ac06b4dcf4078b9144085518dc04b71bbc0a13a09c0df0f9a40d9b7c5be9ef82cc0c6978540c16a3b3faa4ab63f87075bbf21569fc030aa7e3faaa333400bd6d23fdb852c40e609b23f095d7f3fada5ec3ecf7e7ebfc22ea840227a0540ff830cc031b91bc0369f344053089cbece43d1c0199277be713a0d40a6d7a5c056cc6540427512bf5078953e970ee43ee84bd13f595f973f1beceebf992d80c0eb3c27c0ce7ce0bf125476bf8040193fd1a976c057951e3ec8a5d33e2816c5be91a405c02e710dbf3b587c40dea9bd3e9e7edb3e3b742fc0b79ef43fa3a00340805c503f27b3813fc607aa3ff76da23f385c35be397b73c061bf8ac0058210404d9de9bef5debb3f397598c06e899abfa77ed83fa2ece2bf0b35f1bd850acb3f69e5b43fa8ff5dbf9d78d7bfba9c6abff9527640a96a45c0b67f04bf2ed2dd3f0a3dadbece30b5beb0639f3e8af4413faa0ad83f238a0ec0005e15bfeda3c6bf474f99bf3586ae3dc35a3a3fc7ec0abff19988c08f713a4052754040a25f4fc05db09ac07629dabf422c66405b75acbf2567993fd17cd540895120408e3a5040415696c045c0bfbc32ff3dc03a2e67bf1aa7e540451bec3f82dade3faf180e40d67afe3f26b275c0026ac9bf00b0413c05689c3f75c251c013ef414088cacfc0088fed3e63d288c093940dc0d558acc06d6c8abf1f865340736147c0069057400e8f054021af80c0fe7951bf1a92223f306b4440bfa3a5bf6398f43ffad87440307970c03ec1254005434e4025f5c3bf4ed93ebdcbd029c0117272401f0d0e3f37b164c0b71c17c03e87563fcb806040ab50e53ed820a6bf611f6ebfe88bf7bd47c6ecbf5e48f340a09814c0c3b108c0066594bf25e2ec3ece1b7bc0b1227ec0159385c0aadbe340088aebbeb133793fc9d5dc408d3037bf207570bfbad298bf5e3f5640573e1f3e55230540fe33a7bfd55663bfab7fac40a98eeac0e7f7ef3f0bc350c03dc6004013bf27c01fc42b4059fe62c07017f73f2a56973f2fa0af409e7b803f4eaca5bf273a2bbfa407813feababfbfdbcd8fbfaa40094088184140621c2040b3914d40f71f09c080a5953edb6885bf6de7124022330140a7f782c0ab80c9bea90f663f197c1ec01b61db3f88c95e3ff8e1d53fd597173fdb697a40834126409a6b12c0308d664010cfe43e36a0bc3f9dba42c000fdfbbd1df516c0ebcd833ff921a53f375822c0056e46c0710fddbf814859c02070d7be08f42740f35aa13dfa580abffb3f2ac0d72f1abf4ee3113f174615bf91eee1bf526d0740b65c86401b183a401b91953f6b8f3ac0a9f72c404783a5bfc2ab203f5f6883c01f5c7a40e051c6bff0bea2c0e6e400c07a9f78be3017a73f7e79f2bee7904c40626d0dc0c2b02240b8ff61c06368a1bf5eafe4bfa92b9a3d174510bb271c01bf8834bb3fc734b5bfa31c2b3f4ab78d3e2b391ec045dcb63ed30fb83f22a32cc0e62afdbdc224f43ee20638bffaf589c0a7589b3f11529ebd5a0a4fbf98af9ebf6cfb10be6590d1c08a8d5a3db0809340671807408aaf25be5bc686bf63f0923fba51b0c03d1741402f0ffc3ff8c9c63f1f3befbf70925bbf30b194be5e3837408b3cad3fbe1405bf0fa211c00eda5d3d41690840714e6abf67a180bf728686bfc7bc93bf5fca81c037f6bfc0632be93f87ef89400e1d0dc08fcce53fe0ae2940224d79c029970b3f21b939c0001d9fbfcef29e3f90e2ad3f7f712a3f15ce25c0e8244ebff5d4ddbe2514044005d9373fe12bd23e10eb1d40f9fbf5beb155a73f3562dcbf25fe943f7fce3b3f4e942f4073a1fe3f60eaca3ea0e5343e7d4ea23f26cf16401750c8bf16a48a3fcf0a66c03d9da4bead2eb4bf8ee4e8bfb4178dbf1677f5bf1e174cc013e48c3fdb3eeb3faebe4cc08add4840ef2ab93f134094c075ec32c0ad0c75bf4defce3db25c1b4037979abfb9342340d965b7beca5e3fc01df0f53f28cf80c0738530c08758c2bcf84853c0120f5a3ff9b04dbfbb3d44401ba82740ee9060404f6018c002b77d3e9e5eb4bfe18e533f2f704440a3da97bf8e6c0f405900fbbd85c359c0b73beabf406e1540ca929bbf45577b3f501b8cbf2b8393bf729fa7bfa069cc3f4af922c0fdbab3bf0589f5be1d8437c0f871ffbf969a8d3e3f9e82bfef645bbf3b9e613f4525aec007979b3ec9088440f33e03c0fff6d43fbfcf6540105376403712aebf16d225bf49c34040475402c01ab8dabcfbd795be7afe6d3f28c1fabe2e37f23f2b9e3e40a9dedbbff3e4dabd4155de3f48598abf96384a3fb25c9d40558829bf101fecbd9fe2c03f08a4bebd59ca85c0eed180404d929bbfa020533ffba5bd3ec0788040f98347be782a5f408a286b3f8e66943ec91072404e46844099cb0cbeb47b903fc797ee40f6f79cc04ecf8340aa082abf62740fbf6f3efcbf53835140d3c109c039760e3e07279d3fbdbf1c3e8e109abf005489bfe7f07e40cf48abc040649f40f0c2a63f027dc33e9a4d22c0bb130640f92aab3ebd9332c06a11ccbe30128e3e121f24c09ac845c0e1e38e3f17051140a24ac4bff5298bbf600754c00ef40b40570c4e3c720601c015d3c6be2ef1f33ebb57ee3fc8088bbf01f896c0ebb9ab3f352115c03de7f3bf4d55dc3f35e1ec3ffd0e9ec053035ac0721b293f05488ac095f097bf704a2340d740da3f09c1ebbf02262840170860bf9afcfcbf34c68240c051d9bf3fbc8ebfd9a617c009bd2f4060244b3fabf708bf76a0323e3eada13fa0de3cbfaee22d4032260ec079a100c07ff626bfebbc523e121dd23e3574d4bc16f472bf1b95d93fdf4967c008faa8c0e3c670c00b298fbfef45823e07a79bc0509a12bf17044ebfeb7dce3fd1808640bfbbc2bfefb04bbe0e9c28c0b15bcf3f536b17bfe6b16a407242f8c0e990534075936fbf9a9635c0ff94493f21489cbf806d99be711409405bf016bffbec723f67bf1bbf3672d73ed0335540d2003cbe221a3240926e793b452bbbbf90d1bd3f5a53423f1a77f3bfa9f19d3f0f1c26402bc5e6bf323217407305503f994eb3be4bed5340d51d783e3df3c3bef0fe3e3f1f7bfcbef51dda3e0a21c6be232541be817732bf317ffcbd7a211a4031b0593f62e5b63ff78302c016ad1a40fef1aabfbd0d1240c5331ec04b8829bda04540c0e0a7d73ead250f40d52017c0565623c0360e3e40a049f63f257fe33f0617883f154680c017da7640221c1d3ff3a0dbbf7ab6b93f6957d8bf1a3db9be90ffb43e3f6f7340a6c44b4081c5b4c01f5479c07037103fe05a46c031a9e93dd8821c4062cc833f3790d6bf135627c0caf08ac0b892bfbff384c53f826c8840f8286ec0784d8940faf4af3f27f132bfa5b96a3f30c9743f0516623f96df093f407107c0978e25bd4d8cbf3e050ef0bebae62bc0908927404e3acebe53dfbf3fb99e2ec0eefd57407269743fced7d2bfd82ac1bf4a87b33fa1440b40c7ce974057772abfd679494066d904c023d40ec0a2261340aa47ac3e77d0293c2e55bcc085f6af3e22f0ca3fc2f1ebbeaf4680408fe1a0c089b83fc02841994051573840982b7d3fd937bc3e42cbbfbf23eb7040d808063f3a3d913f45b14e40d3136e3f5b7749c07d559f3f00adde3e6187fa3f66b79bbfebf685c0c21538bfd37acf3ec7cd553f98d5a340aed7fd3fb0bce1bebfa1c0bff74044404581b0bf6bd935c0a175164008c91bc027964d402acab9bf528e16c09783993f090020bf93c702bf4931623fd6c3314022ac7b3f407621c095ddb9400b3dbd3e50cfb3bf40a1913f6a45943f9abcdfbfa03e3bbf4dce933fb3086c40dd8abfbf1980acbf8d589c3f6efc67c0c6cbee3fa9f7733f0d5cf13df3a23b3e70cb8240b8fbcdc08aa4fb3fe98d5a3ff184a6bf11d363bf4056e83fc53ae2be6e1c183f603971bf6ae3bdbfd10bb2bfbb6aecbfc8a69ac06e11573f869dc33e9ef9f3bf0d0960bfa9d6f33ff0243abf327842c0befb22c07e2512401e7636c070bdd7bf6782a03f973efdbfa3ab4e40614a86be4864533cb8acc3bf81c5e5bf3afeb5bfdaf9ef3ef35a0d3fc1e51140c0e8d03fe7328840c6cfe53f308938c0233fa5bec06a113f993ece40794d3740782360bf12d14fbf7b86bc4010667340ca33bdbe62c2ba3f27f0cf3dd54796c0b32f92403ece2d40300e8d3fe73ee73fbfb5a0bff98996c02d291d407b0ba8bf519506c03011a4c09a206ac0a36c453fa7fe303ffbc49e40c7c4a33fbee496404e4f6f3ef09bbd3eee81d53efe3bce3d6355cabee516113fe9ff8cbf6832703ff90b27c057aacb3f8ece90c001f55b40b1da00c089e751c07ff255bb4b4390bf520afa3e73dbb7bfca263b409951e53f1ece8b3f6d61f2bfb218f93f9eab8dc02d1f0bbee069484010f2bd3de841444055f94bbfd6728dbf7720d2be9e7500bfbd9d48c02dd62bbfe2c60ec0fbdb4d3e5e8692c05667f23f8f6886bf73891ac090f4c33fd148804032b38abe4326943f72f004c07b1dc0bf65bc90bf6509dabc063c45bf352c943ff33c15c0afe47b3fef3708c003b28f3df12c133eee4adebff9ca46be8281173f009b4340e69a61bf46cdb040ab70b240164b5f3eeff828bfc66946bf07ebad3fffd781bf4030a83f563cc73ff05c87c0db89da3f6676f8bd79fd853f754e32bf68009f3ecd3a4abf480544c00004853e3770a340c8260abf7e4dc8bd0947a1408e1cfcbf57ae59407bde55be5a18c63f4d06bd3fed25f8bf01f552403a87a9bf00d13d4063a602c131295ac0bf978ebe22ad96bfe1601dc004ec0f4022d6fdbfd71b933e26ee2240c6ee6e3f7b2f92bf286fe73f32758e40dad18fc0eac5d640c27ae4bf8617303f590c18c0f0382cbfda1f06c0c766eb3f25c8d73fb933afbf8b4b213e28cf68bf80f449c0735d10c09fd8074010f77c3f9591863de979813ec127f540eb191a400ead4ebfd36c9c3f6da743402b3e2340796e6bbf76e3dcbf06f7c63ffd6c2dbf5a87ff3e1a57a0c0f252ea3f9e11dabfde90c43d9854d840a3e3c13f20e7b13fc55d193fbf3c0a40da6ea4bfad99c73f5b650f3ff248c93f0135743f7c5301403b8d7dbf150f60408f2657c08fa774403b9ae5bf56b698c037b3ed3fe25f39401cc81140a06b5340724e1ac07b6eb33feb3a44c08abf0dc0fe8cf7be08136cc00f52cebfc0bd453f5884fa3fa34d923e3a40c3bfe179aa3f33262ebf5ad774c0719fc2bf31bfc4bf591327bfb5bceb3f51a764be09bf264007a38f3f923969c0b1e6c33f526454c0a75fdbbd0318ce3f83417fc017e861c0fe7d9c3eff9409c04062d53e3139f8bf1c7989c057fa47beff30923f659114bf921ef3bba2b84040a2fbaabeb0c250403753404053f2313f9fbb863e084955c083a8d23e9b85bf406a29a5bf85fc93c06b0dc93f5a7e91bf22ec30c085d337c069083240029ddabf0847a3bfcec65b40952ea33e476c0bc0b5f6d5bf87c9f83e13f81140a2c6d4bf5a61893ff5e2b0bfdbdcad3eeff7b9bf99839a3eddf426402a20b1c0edb88940fb645840efc0483f2e6dbf3f25a40d40d55c51c09fa10a3fa33090c060c3574043bf0bc0f77b5e40cab258c09e0d4340282f0540b2c8e9bdc28bf7bfa05818c02d4735c00b181b401d21cfbffd104ec08e502740cec21e402de66f40654160408bd1a73d0d6a81bf682144c0d91501c02857b13fc1d21540fd3aee3f47edc83f813109c0bb15f2bf8adfc13f856b823ffec38d3fd7be8f4082aa783fffb2febf2a211e3fcf8a243e010b43c017fabd3f78ed193e8e831e3f42cc12401a6903c04f78de4089b94a3f0a8d953d695684bf5f16eebd5b904340283f4e3e6dbf4b40e8b6c8bf9e001b4025496240e7a692bf76bd11c0d1652d40f18a7f402ab258c0ce4eec3fed8d09c00ac63d4039e97abe4c27923f991a67404daa424060b8b1bf78699e3f6b40a84020a5933f8b6a03c03bdc90407add02c091f517c0cf11e7bf502aebbfe595a53fee317fbf030d98c0e84bd9be11056a40db0b24c0754d61400789acbe63fe824090f6eebfb211d0bf374d40c00df808c00555463f653fa6bdb33bdbc02361a2bf7064f63f6fb75c3f4e16a13fb04b193ed2c094bf21761140f1b90440c0fb883fde28a43e61ddc6bfb38c37406b14093f580e553fca15e03f8f40aec0b2384b3e2287a03f0e54463f108ba5c0f086573fb03592bff25038bfa926cfbefbc8bfc0b2e7534053de5d4079649c40bbcbb7bdd750debfb82a514080cc6340696458c06e8cbf3efa00abbff5fc0cbfde1775c0660f28402b5d0840e73d56409296813f1928984063aa62bf8338af3f82e495c0a7d0c73d29406fc05a4591bf3a93954012e7f7bb69159bbfc7e8a34043dc7dc0c08b1ac0ad40d4be46971abf67f5ed3fd1fa07405670353f75674bbfab0ab43eb30c5d404e33163fb8e5b93f8ffc5cbe278d1bbe6263ca3e0729303d3758bac0dfaa4b3f1b5a8540c2dfa6c075c2c6c0983f393f1f4c4b40b377cbc0893687c06644e4bf73547dc0bd190ec0571fc9becf6104c00a994f40830aa9bf5dcb1a3fdef7873f9da6d940bff064be1f8384bef7664abf6e008b3efd8e21bfaee07ec0e2e5823f9602acc08be60b3f326f203f1baad43fb519a140e0e7c5bc89bc213f46b7683e95edc2c0e9c703bf1aa4a6c00fbd1c3f470be63ee73fd5bf08361ebf4a7cab3ea6b114bf3f6b11c0bcda843fba0a303f9ebbe73e0b10b3bfef2194bfb9110cc032a33f3edc1003bfc0bcf5be2b28ae3f168ced3e600b40c012b1fe3dfae497c0eb4fb1c0f279983d4d3e22c0f53c05407ae298bf8849f540bfb100407a0c82bf32b029c00061843ef256383fc3baba3f2dc0c23f957e2d4062bee7be329a2fc039f022403d484d40fc12863e59fea9406ba326409b15203fbbf4813f155b66c007995dbf1e3eb1bfbfda49bea99ca2401bcc393f6f8b783fdb878940db85bc3f854c14c01bc995bf3f15f43f02953ac0f7f056c0ef39eb3ef33c013f518fb540eb405a3fd86569408ec1aabe362e3ebfc141bfbfb273be40df068ebffb878740fb8992bf9dc2a2bf7ad9bac0dbc41c3ef85da1c0c22b82bcbe7884bfee3604402dc50b40332f653ea705223f3f07763fe5a763c099a134bf12181440384ff3be7359d83f190299bfb9eb6d3ee96e8ac0f3e2e4bf7a5ddb3fb2e62dc080723040ea362b3f83c6a9bf979445400f92b7405f05e5c00964763f8d587740cd9ab4c06db90d40790318bf430386bfda271bbea16dbe3f9206fa3e8a13cdbf923cc1bf678e4fc04ddcfd3f9bfe0d401a53264042c7813f793e1cc0998cc93f4d8f38408b040b40d63a5e3f8a105a3ff710e23fe71abd3faf380cc01d14593e4fecb23eee8466c07962cd3fb024833ea99f50bfd72004bf6003a9bf5f0aaebf17a9a5bfa9cbfc3f776419c032b7303f76748540690bbbbee23e3f402b3ef63f8b7994bfa6f56840858ec8bef573e7bd115844c09e90e33ea2b438407de8093f0568babf294904c066e03cc02753543f1bb514c0024e8fc09ddc3d3f2aab1b407eb41ec0f6645dbf2929a0c0c07c124050f47bc0ddeed1bf1edf2e4010b0833faef429c01f77e7bfc600eebe9104554009db75bef840684070aef83f227e344082895bc0b1ae88bf6a30c63ff62acd3f109772407e216cc0bd931440e1490b41a5c04d3f6bd04a3fbe0058c09a5780bf83c1913f7b0043c0e2f008406eb907bef10012c0d562b3bfef1c8b40c24983c006af0540bb6f973f994dcf3f7a3e93bff85809c0384e3abff10436c0d5d81ebf36ecab3e97aaab3e8e773940be3f8bc05141d33eaa5f5fbf9574d53e4aa6083f465731c0b5b3423e11ae074003297040aaaffe3f0e20e73ea938954013791bbff74e294078effcbf2522d63d29dd39407a77503f48534b40a04e924046f95640c3927b3f92712440f5a15abf8a35fd3eda437b409b793640f69ab4bf323e993f8b05ee3f89d68340237fcf3f37c2c7c02337bd3f236f2c40389791bf760dc9be0527693f7b429d40317e5fc00e2791c063f4c03f3ada8dbf495b15c06def9abee058b1bf7ae877c0dea0febff7b4143f921b6cbf79bceabf2d5055bf12f862bf09d74140ff9886c0fb4779407e4faec0b0ef903fbfbf9dc083e3733ddb7c8b3fea165840be9b71bfc0f81a40e2136540e7dba7be9f9e48c0a90d9a3f9a2ac43fa200a23ff569793fc2ee2040ffab803f054b68402ba90a40e06bfbbe1ac8bb3f35946d3fdf3089407ffaf33d06234bc01550ad4008ca903fb63108c0dfd38d3f3f888a3ff97dc4bfe1485ebc7974c6bc89d9923cb73009c0cd04903febd72440bd1ad1bf76e7a6bed9c154c0a80005c0bd29cbbe526ab0be81464f3d1e3d40c0eb2098400ead1fbe3938dcbc1b0210c01530ea3db957a53ef1982b40e7692840c9ff7f40a26e2840e62117c08762c6402a6ebabf44de8f3fcaec714009e66dbed72bcd3f6286f3bfb6616240909ff4bfa0a8983f2bf1864016970940177906c008ce3ebff7505dbf9a0203401eec31406e86c9c0815ce4bf1a5293bf8aa5f03e21beabc01768553ea7d59240be860a408773ba40619644c0a6546fbfd050c53df5ff224003a93a401db3b73daa8e633d898de33d5ff014c0bbbd283f891e57bf33715cc0db2039c017a411c0e8d2ecbfc5788d3fa77e2040450ec5bf157957bee6726fc0e2f69b3eb0214f40dd2bff3f6a1c85c057cb8340c8b28dc0af2155be500fa03f1082d9bf552861c0948d11bf92808d3f2f33893f9db7703f218b81bfc9f4004005264640678658bfddd0ae3fa81aac3fda9974408b4f46c00e82a63fabf3ef3ed0282840a2bfb6bf4bec7240f3763fbefb1c3ec05d0de6c030f3fbbe73162cc0259279401dae15bf825d6a3e4bbda1bf4b943bc076d6e7be71c1a940ff2182bdf9639a3fc7583d40b8b9acbfc71489bf93fb03c0f7ed12402533b23f51122dbe6f9aa0bfa931d13fbd790c40bb61853fe530e5bf0113c03e5727184002dbafbe98df213f6526cbbf4a836b3ef7d23e4062690b4015f589bf0360bfbfe7e54e3f23eb3c40a406853f5bc4773fe9880ec0780c55bf336818c0052ec74020a80bbdbb6b2440f65664bfc9d1f23f67c95c3e20513fbf35422fc02d1a32c0f5a2a53fb332843e09c3ac40df8ed43f79ee3c3f7b82e63f66bcdfbf52c64a408fe6f9be6eeb10c07252c93f2b7da8bf45bd0ec0220adfbf97ec0c408360abbfe02cc3bf1d817bc0152fdd3e66646bbfc7824bbf5d190b4080222fbfd20dd03f30009c3f70c3fd40f0d4103fb51c463fe32138bfab9c75bfc2c1c0c069fba4c03aea1abf15dd1640fb9898bf97c6d33f6d394a40b715893f77d0a340dd2456beca7e653f292949c029bb6b40622a843e654337bfe3139fbf95d50b409919d53e1ede33c0b1196b403945b1bf76dd7b3fcf8dfe3e95699f4068a759c0ff2642c0b01d3640b52309c0de4fde3e0f7d2940608948c081d151409d1a01c03f7a974035ee16c0ef1d2dc09846993e48b7a93f25fdcfc045e48d3ea73293c0134ec73f3b4137bdd5cf9cbf65014b40c3dc22c0693f0ec03b059740027730c0c90ea73f17e1a13fa1e85c4040f7883fdf503ac02bf7c5bf037317402a77623f80912f3e2b2d4140d5e81dbf32fafcbf1f503540b14e57be78bd454002c29840f88f99be8df015be6e82fbbad0b86fc052e63dc0032cc9be85caecbea14d0a408ef397bf46f3b93fe2378e40e936fabfaf2a883f384e593f2942ba3f45e057c0e993313f8e15d9bc2f0b0840a13553c0c94de83fbd014340da5381400f5d50c0bd7789c02e8015bf81949dbe9455913f5124bac08d605840de234fbeeb5f2640c1cb683f065f9dc03dc266c0d816d03f66e588c07912e1bf2593c63f088578c05f9fd33e3037a440346c08bfc75eccbecfec88c0c6f040bff2cba2bd69453e406038613e0d14e4bf87c707c079848d3f91debd4053208dbf16fba140b9bf723c25b89fbfe62d4bbf922fdb3d79d801402f363bc032501fc0e78178401765a23f3955a140861185405a02163fb77542bf55822abfb72ea3c08a4dbc3f41d87abf38c530c077c99dbfb1f0d13f90b7f43f08ae723f5f330140e3d4263f59e511c038827d40d9485a401d2de1beb8fd0dc0217cf2bfe04dc03f18d4d7bf1e2579c0776bbf3c015e0340211e853f8b06a3bffbf3c33fd0a62f40da234040a21566bd6eb4f83fd6e48a3ca1db833f695f08bfaada2ec088ccb4bf9572c6bf9d0d9bc0793bc13f2b0a0f40c500d1bf3bf969c050dad7bf67ed81bedec9bdbf70698dc086a5afbee9b015c0613bda3e9e460dbea9f960c03df387bff22f8a3f92a909c03a4a083fb07ab2c075b59b3f6205434097ac29c0fa3e9e3fdb7576408dbb22bfd2038f3eca7a01402ae440c0cea9b83fd960d83f12b210bf8931cfbd862308c068d476c0c1ad89409df6193fd61a0cc01d2cb2bf2dcfedbfd2d049bf20d1a6bf814d8a40baeb81be715b90bea2e69cbf27cb05bf956352bfcdca23bf7677aec01b2a993f06f863c04fa03140b0fe22c0fea83dc0fe14adc089b00340ee3bbac0690104c0d094aa409f731640db5193c015d032404fafe93e51e9d83fe22093bf5eb3d4bfcf209a401b77093f853dd93e0ad75fbfab7a50404d1a7d3dc8901abe6bdd3dbef5b0b4bde239d7bd5edcd740972b1ac0880e1840bf1c4d3f20137140de5311be22086b40438b93bf95d33ac05ef7eebf4d3fc740977524c0209ea0c0583518c0c07526c0f56506c09ee76e3f453f3a40a76f28404a05a7bf950144c0d32c5bbf1901f5bde9bcb8bf9b0f7840c30e043f1fcbd1bc7f9ec6be5f74b13efaf2fe3ed3e346c071b7e540f910a73d23d4ebc0053b1dc089463bc0419359c092bfc8bfb5138e3f77698b3f37ff233f7876bf3f2bf6cd3fc1e6c9c065a2ce3efb918d3f57d1c43db6a396405baa52c07f4467c067b1e7beb2cf6b3fb93a61be67f6b43f4b003b40b56c86be97799ebf87220040ecb085c0739969bf70ada53e7bc791bc911bb0bfde5200c09561acbf2b4ed7bff69fe1be5e23173e05c8e33fd3aa05c052f070c047ad6bbff9f52b407af8f33fb26e1440694966bf91b63fc077ba1cc0f64a93c048a6f5bf46445a3e7f6e203f07d44940fbd942c09a02503f5049d6beb91d1f3f28bfdcbf0ff2dcbe85f942bf56d0443f070d16c01ecc0dc0557256c0d138a4bf251fa140a7da0a400a8065bfedd34c4032ce85bf554589404b3d4cbfa5d6e83fc693863e2b52c8bf4617a1bd92b812406522bdbf09f10f40b15d15c0711805bf57e1e0bf5257f43d01b4d1be68a8c2bfd0bd6540cea221c0aa0504bf21eb02402f8436bf101a22c0f24f1040db451a4028744340c7d729407efa3fc0e0b576bfee7d92bf68d1a4bf716282c0195daac019b09abf5a1670404006f0bff1834ac0e32c87bfbba218405026cf3f1e733240863cd83f012a863fc3831bbf61188a3f9da21dbfdbad893fcbd99ebf0208c63dab769a3df1a8d14055ab58c037f60140ebbe16c02dda6640e1f817c00f0f1c4078452cc0a77c173ec951d93e8b8e8ec09d5305c0a924c63cc58f703fe72d20c01b8ca2be65ea224032a39ebf37512d40b5a90740b2192f40d95e2740353b3cc05781fd3f8b4a0f3f428a39407afd5a40f516983ef7b6a4bebd5e93bff28e8a3f8d373a408d0eb93f21f96f40e20634bcc083323f5b3ffebdd780bbbe10d1cb3e70e2e03e567019404006544023594f407283f13f42652f3ebf7f8ebf181473c0bae9cb40da992bc0452232bf2d153f40ea4696be39f9603d8fdc34c082d15b3f67e715404052b73ecd0d8ac09b3bc1bf7f2eaf402ae9fd3ea1fa2d40407f91c037b5373f11f4513f1d193e3f4388a3bee54437c03d301940e09a9fbfe51515c0c6be503f7ab25dc042a15bbfee307a3f7b8978407bd50e402befb3bf9a76c540b3b213c008d6d3bf0b96233e785dd03ea6854240f790eebf203687c032e68f3f73a120c0901ccbbf9f301840bd9c39bf776302bf5baaabbe443307c0c5f08d3fbe84e63f82e9fdbf5250f2bfc7a00e40a9f393bf33fa59c0963bc74003c328c0e570414080d854c03005643f52c2853ec7a27f3f35d3973c9eb80ac007f537c0d7012fbfeea740c068a163bd66ad64c0b6b5f03f58889fbfc577604018ba87c071c12fc02a0170c04e3d9cbf5dc626c0a6040ac0a616923f7725f83f8236c0bf4f472d402a153740935a5f3f3e2d2dc0c547a03f282d1fc075895a3fd50290bf12c0713ecd02afbf3eb227c0e2037f40c309743e3f8890c077502a40d360f93f82861abe8f3b3bc08e3cbf3f3571cc3fe5683740e3ef3f40c8cfa0408be552bf28f6afc01627074020d72e3edfdc2dc078f921bf0ed2f9bf0d8c0ac005ab3740187dc640e3afaabf4d90043f4357313ed01b0abef252f7be19a2d9be25b08c40757bdb3ef90659c04887d0c0911c2bbf065013c05016c13d6e869ebf178f62bf621798bd06ca8dc029ab06bfa89089c0c96092c01f00853f1b3fb640c7a2fb3f8c5a0840126079bf9b2155408e9c32c0f2cd1540634e33c0106867c0c78408bfea200ac087c9fb3dbe019f3f032d364032700ac0f781cbc0cd763a3ee935b2bd9bed3c40d5a104bf07128dc08080c3c06ee1f53fa6ef72bfef1356bf60e73ebfee4f28bfb86e25406086d13fe0dc11c050dabebe06bd4dc0bd65b9bf4b0f71bfa21443c01922b23fa7a6d8beb38b7a4002acd4bfca798a3ef056c3c0e1675e3ee9a8fb3eeba818c05f6594bf3ef3993f058a40bc9842303fdd070bbf3946cdbf21fe9a3ef96eadc0411ae63e1b35133fa8df183f46890b40b0176340db764b3f494c85bd1989483e79075ac03762c1c0ae2add3f77063c40d9f48b40e3abb63f77122440a5a3fcbe05310e3e020b9e3fffcf6cc0c8144240da9eb3bee2d4dbbf50f765c0adb2b64015b440c03fb80ec04ba31ac099024bbe806715c0771abd3f8854c9bfb6fa293e5dbd00c0ebf924bf45cb55bec3025bc03e1c76be96be02bf674153c0f14c3240414b263e1863a2c0727b51bf85950cbf12778c40efe86d3f8a68b5bdcd8a83bf9bbf51c0fb08a03edaede7bf9240b3c0f2a087be048f0dbf9badca3ff7eb3fc062c94e40a3cad13fc48f10c0c7587bbf584498c021b2fa3fb22496bf897af4bf321adabfa7f5004019cf624039d787c01aa22940e9189bc02fcf08c051186e40152be53ce9b062bf5878b93f581bc8bc4a1d59c0075a93c0501ca73fb7d14340908e99bf6e9a3c3ef67870c0e0999dbfc7f40c40372601c0f6c6d9bf81320ac0552de8be53e98e3fe907e1bf053b65be3363bdc0202d37c01853dfbfdad53bbffdeecf3fa589e9bf1a86643fc024be3eb3b2dfbf4e63a53ffebf3540aa1f05c07e4207bf50340f40329dd73fc9031940a81834c01e34bebfb64c5cc08b3131bf5b42e0bc7dce7bc0477645c029830bc0984745bf1e6e58c0faa161c0d366183f602e00c0230c314063b55940c31fad3f6d4349c0ce08fabf107bb93e183f1ec06abd90bf3947823d13300940630b28c06f1b28c077eb5f3ffb481b3fba559ebf3a3d6a40b7347d4020389ebee91705407fec893ffd2c703e887186bd0999fcbfadc0a3be11f040c089db7740410df3bfde61e5bf694758bfc388d23f5a9698c003744f3fe13c164013938fc047d91e3f8a299d3f41c97cc03ec3f7bee2f209401e998dbf3b994c408e8b1d408f0de2bf6ad5b7bd5ef0be3edcdb8540fe061840bbc67b3ff318cfbec3e87bbef33bc93f1b20c3bef008dfbf07819f3fa560924025364ec09be35cbebef873409e3a923e0dc53a4089eeb64060c036c00ab8cebf65300c3f9e86e8bf0dc930c07707edbdd520bcbfbab43c40e68d613fa5039a3edf14af3fd977babf7816a8bf67b5aebf120415c0de16f53fa72e92bf1abae5bf432d424066d962bfe61261bfa06355bfb0849840d8a957bfc11de9bf5dcfedbfc04418bde94293beed240dc0c631debfb1e16c4025b413c045c24bc036bd083fdc8c863f26f6b8bfa227bb3e41e783bf6280ccbfb8fc22be4f0234409b82eb3fd0115bc030326cc0b8b41c40671f03c0de6bc640b9862b40a2330bc0b71f763f7fc72fc0a6d99ebeb7f9b43f50bad13f6742bebf67a7983f9aa89fbf22c3dbbe04b80c40d80b53c04005953fdb5474c071569fbf1b7acf3ff30fcdbfecbd81c0055791bdd0ab27409447904041b062be2968f9be90e492402ed2dd3f97512d406da17cbed139bcbebeee52404a06ecbebbc31f3ef99099bd32be873ffe8083bfe117df3fc5ae1ac08a9e9c3de4aa82400b27d8c0d87b28405004f7bf0af98a3fd5b03340e7abe1beab71193eb674ac3f10b674403676e3bf359110bf90f7d6bf062643c00e42eabe9a4150bfa58ec9c02ae425bfc86b90be6047cbbf02b647c0d93521bfcdcc98bf358c3dc0aea82bc0f1dc403fc05b9fc041c30bc08abffb3f6b41d9bf8aa3fcbe20e1f4bfb900e7be5ee02abfdb56a0c09693c63ee5d4cdbfe61f6fbd1011323f3f961140676dd4bf43dfc1bf5254a43fedfc31405bb8ec3f95ee7bbf9a11adbfce97153f9c8309c0422a363f82d99f3fef9cdbbedd380b409095aabe03f322c0d5f9e94058fda3bff91741403a84e2be6b767b40cacfa23f25b5ed3fb1df9fbf82b59ec0a9bf0bbf9ea8f1be4f99a340039e3e3f9a392640ae1435402a5fb8c012304f403a549f3f9faf56c0893f1c40d77028c015228ac0cab0f1be365ee5bec3c00c3f4f051abfdb30f73fde8486be030bb4bf1774e8bf786115c0dbfce13ee2a79b3f372810408a914f40e77152404af3aa400ee9ebbe6ba152c020185e40e3389fc0d0de6d409276c8bf6f8cbbbf239dc340d52db83e53cab5bfd794a53ecaca31c02742f5bec1bd11c04567873f2ea71a3ddeff1d4020c34840025ed6bebf4400c02b7c3fc0df36acbfbf1b923fb1af4540906ed0bf322b80bf1b76f0bf73db34c079a56abfe891b6bf1be78e40f2a43d3e073731bfde4ab0be00d62abeb900c33fb250fcbe229609bf4694a5c00b511ac05d40473d72920640e309a83efbc6f3bfa0324d40b96449c06b53963fb6349dc0f749c73f48f8aa3f68aa55403e956fbfd78dc53dc9d424bff8948a403b1d8d3feefe2ebe263caabff35f1e3f939345be5ae0c5bfb72fb13f894b6fbfd2ce49c0d6c8414087c487c04be2c63f0ffdf4be32e3a5bf0e42c03f9600ac3f02ec32bd6b681140b7908f3f09ab5cbf1d1e1340fef0c3bf8282a4bfc8e579be6f6b6abfaf3b64c00b672abef7d99c3e6be7dc3f5be125c02f4cf43f4e5de4bfb146d03fd84f98c03dd7de3fbbb6873ea642a9c06b22133ff7058b40d208c1bfa278d63f597d9ac0def9a1bf392c4bc0b658d7bf798b65bf695f90bfb1401940782d6dbff544aa3fd87826c0992194bff3030bc02b5c56bfd3fd1240b09cb7c0b771a7bfcb834f406f3e22bfaed728c07f5721be3738373f90ab123fef9a1240c9549840fd50f7bfc72a42c0835c80bf0861d7bf91c112c067d660c045c317c035bea9bf5654b540d702933fce36663f2b976f40984a2f40af7872c0966da340bd8e04bf48f849bf76e252c0a98fd4bfe2328d40c436873f0298dbbe8088323ff7bcc4bff777464087221840de3a96400b8bd3bff08bd33f5987743ecb0835407704953dc5c2c23fd026253f10746dc008a2e8bf7a2021bfe1b300bf0b470bbf454083c03bd03dc0a867ee3fc89e6b3de69747bf63ff653f9f9d69403a54c43f2f04a43f7a9986bfd73e983f86a6b0bf2fd7d9bff21faa3e03c43540b91999c0ea112140a7e2393f0670903f0b65b3be73b70640a82a19bf8862653f73dc5b3f1154b03db9fed93d50f2c73f16ea91401e11b9c0289702be07016e3d802725c0c52f0940f0b9543e40ef03c08658923fceebafbf77b44240cb667e3ebd4b14bfe2d26abebbf4ed3f7a4d8fbf2f2c3d3f676af63f87d31c3ecf80d43f8f75cf3e61401fbf8f57643fc75815c0ee4ee83f42a2173f0e8f1cc05b74b4bf7696f340908e3d40051e15bede1d9740668641c042f76c3f223ffe3f6560573f76b3983f9197aec04548bdc0ae012a40e980bcc01d0d9cc0eb383d40fd3689bf0d790abf0f8fa4bef2a9cdbfe19af03fc31d8540997aa0bfdd5dedbe6f238f3f702b9340a69b4ec091eba33eaf6e0440bb4a194081ce1540b20622c0b55eb5bfafba4ebf305cb93e1242a23feb8f893f17643ac07090f83fbdd7b9bea796d53f78b73cc0202c44407244583fad24ffbfae3031c0c67bc2bf8f4e3ac0de9c17409aa9ae3fd80850c01efaa0c0069cb9bf36e5f83fabe499bf7765e4be97ba0ac0c5e11940163262c0f877613f639627bf5600903c721c21c0351780408c0001c00013483e1e286040d908fabfd53f613f6ba53abd3f3f27c0c7771ac030d88d407fbfad3ea5193ac097d15bbfd3bf4ec0f04fc5be6f7388c0d7fd91c00f3a9440ac2608409ae70b40be07713f28f9173fdffe143d1b2904c09ff2aec010a748404bb9d73fd263a5bff9f09ec075062340557a7e3fe53ab1bf41f7433d009a5b40b7020e3c0eefbac0df5d14bf4e43b4bf0594eb3f25096cc0db17d2bfdd7794c0a2fb143eb17703bf5382b13fe0558bc0240f093fca08c1bfe77e52bed9461ebebb32f33d0811bb3d4b4217406855bfbfd3d18abf991c36400b011dc04058efbf5f1a14c006a4113fad46ecbf738fdebdee0c43407865f53f209db0bf73bfae3f602d9d3fe7ad47c091339240c55e823d503f583eb4bb873f284d723e7b0dc23fdffcef3e9d84a3c067b051c05b285040b8655e3dd523b03fae240b3d0afa90bff3976b408adb6d407ac5813fc3dc943f9af700be60278e40f92b2340d5fa5cc0570745c03178a8be062a683f80952cbf78c117c063779fbe19888b3fabeb5bc0d630323fff9fecbfa6016f4097d83a407d664dc0f94578c0e0ef2b3ed7cefb3f0eb169bf7a8a3440359fb33c967badbfe764eb3d75495fc0a9c65e40b3bf36bf66d2e240164601c07d449a409e0f143f8749f83fe0d04540a91e38407aa600c0a9e4743ecb931e3fad1d80c0d5422a40ebff194040e31540eecef1be6af6183f83ad7abf7b031d40e332e8be6c8900bfcdc9a2bff3aa9e3f0e381ebf7e021abf09c98b3e41695940915f4cbf731c27c01317c8bf1d01a740c5833040db5463be2bffbd3f693d7f40ad1b8dc048111440c2d617c029f29c3f625e4f3e058bc5bd45f6473eb85d643fd1c868c0f7f65dbf9757cebfcf7b123e9e8d02c049d9f7be37b29fbf2b84b93f6072cebf012180bf3a6efc3f8ea79a40eaaca5c029f089bfc08b32402ab059c01f944fc026704b40ac4592c0f91e0740a6def8bed82fa7bfe0b7fabf034c2e3f51f1a1bf1a7787bfcdd8cd3fd6ede53ffb211c405203153f6fdca0bf9e4e44bf63efad3f865890c0e59019bff62a17be576486c013950cbfc002e43f7eae53bf66942cc096cb5e408d8399c0737237c006b166c0ff250cbe8632f93f9e53d23ec65628c051980ec005794cc0fb48d13f662e2e4081a45140595034400f8e2bc06f71a540a26667c08df0a1be39f79340a89e184065a77e3f074c31bf566af0be951f74bfba0d4bc082ed503f46955a3fd909d1bf778da5bd299e5abe7b6f5c3db8129f40"
@@ -0,0 +1,126 @@
+import argparse
+import json
+import os
+import sqlite3
+import time
+import tracemalloc
+
+import numpy as np
+
+import embedd
+from embedding_index import EmbeddingIndex
+from instrumentation import StatsSink, add_sink, remove_sink
+
+
+WORDS = "love wisdom virtue marriage wealth friendship rain god learning patience king family truth".split()
+
+
+# Build (or reuse) a synthetic tirukkural database with random embeddings
+def make_fixture(path, rows, dim=1536, seed=0, page_size=5000):
+    if os.path.exists(path):
+        return path
+    rng = np.random.default_rng(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE tirukkural (kno INTEGER PRIMARY KEY, efirstline TEXT, esecondline TEXT, explanation TEXT, embeddings BLOB)")
+    with conn:
+        for start in range(1, rows + 1, page_size):
+            stop = min(start + page_size, rows + 1)
+            vectors = rng.standard_normal((stop - start, dim), dtype=np.float32)
+            words = rng.choice(WORDS, size=(stop - start, 9))
+            conn.executemany(
+                "INSERT INTO tirukkural VALUES (?, ?, ?, ?, ?)",
+                [(kno, " ".join(w[:3]), " ".join(w[3:5]), " ".join(w[5:]), vector.tobytes())
+                 for kno, w, vector in zip(range(start, stop), words, vectors)],
+            )
+    conn.close()
+    return path
+
+
+# Run fn, returning (result, seconds, peak traced MiB)
+def measure(fn):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def bench_fixture(path, rows, dim, queries=100, batch=64, all_pairs_limit=50000):
+    rng = np.random.default_rng(1)
+    query_vectors = rng.standard_normal((max(queries, batch), dim), dtype=np.float32)
+    conn = sqlite3.connect(path)
+    results = []
+
+    def report(name, seconds, peak, per=None):
+        row = {"rows": rows, "benchmark": name, "seconds": seconds, "peak_mib": peak}
+        if per:
+            row["ms_per_query"] = 1000 * seconds / per
+        results.append(row)
+
+    index, seconds, peak = measure(lambda: EmbeddingIndex(conn).load())
+    report("load", seconds, peak)
+
+    _, seconds, peak = measure(lambda: [index.search(q, 5) for q in query_vectors[:queries]])
+    report("single_query", seconds, peak, queries)
+
+    _, seconds, peak = measure(lambda: index.search_many(query_vectors[:batch], 5))
+    report("batch_query", seconds, peak, batch)
+
+    if rows <= all_pairs_limit:
+        _, seconds, peak = measure(lambda: sum(len(ids) for ids, _, _ in index.all_pairs(5)))
+        report("all_pairs", seconds, peak)
+    conn.close()
+    return results
+
+
+# End-to-end rag_system with stub backends and a cold query cache,
+# reporting time per stage
+def bench_rag(path, dim, queries=20):
+    embedd.connect(path, backend="stub", chat="stub", backend_options={"dim": dim})
+    embedd.query_cache.clear()
+    sink = add_sink(StatsSink())
+    try:
+        for i in range(queries):
+            embedd.rag_system(f"What does the kural say about {WORDS[i % len(WORDS)]}?")
+    finally:
+        remove_sink(sink)
+        embedd.conn.close()
+        embedd.conn = None
+    return sink
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the embedding and retrieval pipeline.")
+    parser.add_argument("--sizes", default="1330,50000,500000", help="comma-separated fixture row counts")
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--all-pairs-limit", type=int, default=50000, help="skip all-pairs above this many rows")
+    parser.add_argument("--fixtures", default="bench_fixtures", help="directory for the fixture databases")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.fixtures, exist_ok=True)
+    results = []
+    print(f"{'rows':>8}  {'benchmark':<14}{'seconds':>10}{'ms/query':>10}{'peak MiB':>10}")
+    for rows in [int(size) for size in args.sizes.split(",")]:
+        path = make_fixture(os.path.join(args.fixtures, f"tirukkural_{rows}x{args.dim}.sqlite"), rows, args.dim)
+        for row in bench_fixture(path, rows, args.dim, args.queries, args.batch, args.all_pairs_limit):
+            per_query = f"{row['ms_per_query']:.3f}" if "ms_per_query" in row else ""
+            print(f"{rows:>8}  {row['benchmark']:<14}{row['seconds']:>10.3f}{per_query:>10}{row['peak_mib']:>10.1f}")
+            results.append(row)
+
+        sink = bench_rag(path, args.dim)
+        print(sink.summary())
+        results.append({"rows": rows, "benchmark": "rag_stages", "stages": sink.stats})
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
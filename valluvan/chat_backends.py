@@ -0,0 +1,68 @@
+import time
+
+from embedding_backends import with_retries
+
+
+def build_prompt(query, context):
+    return f"Context: {context}\n\nQuestion: {query}\nAnswer:"
+
+
+class ChatBackend:
+    """Answers a prompt with a single completion string."""
+
+    model = None
+
+    def complete(self, prompt):
+        raise NotImplementedError
+
+
+class OpenAIChat(ChatBackend):
+    """OpenAI chat completions; api_base points it at any compatible endpoint."""
+
+    def __init__(self, model="gpt-4o-mini", api_base=None, max_retries=3, backoff=1.0):
+        self.model = model
+        self.api_base = api_base
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    def complete(self, prompt):
+        import openai
+
+        options = {"api_base": self.api_base} if self.api_base else {}
+
+        def request():
+            return openai.ChatCompletion.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                **options,
+            )
+
+        response = with_retries(request, self.max_retries, self.backoff)
+        return response['choices'][0]['message']['content']
+
+
+class StubChat(ChatBackend):
+    """Offline stand-in that echoes the question and context size."""
+
+    def __init__(self, model="stub-chat", delay=0.0):
+        self.model = model
+        self.delay = delay
+
+    def complete(self, prompt):
+        if self.delay:
+            time.sleep(self.delay)
+        question = prompt.rsplit("Question: ", 1)[-1].split("\n", 1)[0]
+        return f"[stub] {question} ({len(prompt)} prompt characters)"
+
+
+CHAT_BACKENDS = {
+    "openai": OpenAIChat,
+    "stub": StubChat,
+}
+
+
+def get_chat_backend(name="openai", **kwargs):
+    try:
+        return CHAT_BACKENDS[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown chat backend '{name}', expected one of {sorted(CHAT_BACKENDS)}") from None
@@ -1,12 +1,11 @@
-import sqlite3
-import torch
-from transformers import AutoTokenizer, AutoModel
-from tqdm import tqdm
-import gc
-import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+import argparse
+import functools
 import json  # Import the json module
-import openai  # Import the OpenAI library
+import os
+import sqlite3
+
+# Heavy dependencies (numpy, openai, torch, transformers) are imported lazily
+# by the helper modules, so importing this file is cheap and has no side effects.
 
 # Set your OpenAI API key
 # openai.api_key =
@@ -15,127 +14,129 @@ import openai  # Import the OpenAI library
 #sqlite3 data.sqlite "VACUUM;"
 #pip install torch torchvision torchaudio transformers scikit-learn numpy openai
 
-conn = sqlite3.connect('data.sqlite')
-cursor = conn.cursor()
+db_path = 'data.sqlite'
+snapshot_path = 'embeddings.snap'
+
+# Shared state, set up by connect() on first use
+conn = None
+cursor = None
+embedding_backend = None
+embedding_index = None
+query_cache = None
+chat_backend = None
+
+# Open the database and build the backends, index and caches.
+# backend is "openai" (batched, concurrent), "local" (MiniLM) or "stub" (offline).
+def connect(path=None, backend="openai", chat="openai", backend_options=None, chat_options=None):
+    global db_path, conn, cursor, embedding_backend, embedding_index, query_cache, chat_backend
+    from chat_backends import get_chat_backend
+    from embedding_backends import get_backend
+    from embedding_index import EmbeddingIndex
+    from keyword_search import ensure_fts_index
+    from query_cache import QueryCache
+
+    db_path = path or db_path
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    # Ensure the embeddings column exists
+    cursor.execute("CREATE TABLE IF NOT EXISTS tirukkural (kno INTEGER PRIMARY KEY, efirstline TEXT, esecondline TEXT, explanation TEXT, embeddings BLOB)")
 
-# Ensure the embeddings column exists
-cursor.execute("CREATE TABLE IF NOT EXISTS tirukkural (kno INTEGER PRIMARY KEY, efirstline TEXT, esecondline TEXT, explanation TEXT, embeddings BLOB)")
- 
-# Function to generate embeddings using OpenAI's API
+    # Full-text index over the English, Tamil and commentary columns, kept in sync by triggers
+    ensure_fts_index(conn)
+
+    embedding_backend = get_backend(backend, **(backend_options or {}))
+    chat_backend = get_chat_backend(chat, **(chat_options or {}))
+
+    # Resident, normalised embedding matrix shared by all similarity lookups
+    embedding_index = EmbeddingIndex(conn)
+
+    # In-process LRU over the on-disk query_cache table; see query_cache.stats
+    query_cache = QueryCache(conn, embedding_backend, embedding_index)
+    return conn
+
+# Decorator: connect with the defaults if nothing has connected yet
+def uses_db(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if conn is None:
+            connect()
+        return fn(*args, **kwargs)
+    return wrapper
+
+# Function to generate embeddings with the configured backend
+@uses_db
 def generate_embedding(texts):
-    all_embeddings = []
-    for text in texts:
-        response = openai.Embedding.create(
-            model="text-embedding-ada-002",  # Use the appropriate model
-            input=text
-        )
-        embedding = response['data'][0]['embedding']
-        all_embeddings.append(np.array(embedding, dtype=np.float32))  # Ensure the embedding is in the correct format
-    return all_embeddings
-
-def generate_and_update_embeddings():
-    # Load the model and tokenizer
-    # Remove the model loading lines since we are using OpenAI API
-    # model_name = "sentence-transformers/all-MiniLM-L6-v2"  # A smaller, more efficient model
-    # tokenizer = AutoTokenizer.from_pretrained(model_name)
-    # model = AutoModel.from_pretrained(model_name, ignore_mismatched_sizes=True)
-
-    # Set padding token if not already set
-    # if tokenizer.pad_token is None:
-    #     tokenizer.pad_token = tokenizer.eos_token
-
-    # Move model to GPU if available, otherwise use CPU
-    # device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-    # model.to(device)
-
-    # Fetch the data you want to embed
-    cursor.execute("SELECT kno, efirstline, esecondline, explanation FROM tirukkural WHERE embeddings IS NULL")
-    rows = cursor.fetchall()
-
-    # Process data in chunks to manage memory
-    chunk_size = 100
-    for chunk_start in range(0, len(rows), chunk_size):
-        chunk_end = min(chunk_start + chunk_size, len(rows))
-        chunk = rows[chunk_start:chunk_end]
-        
-        # Prepare data for batch processing
-        ids = [row[0] for row in chunk]
-        texts = [f"{row[1]} {row[2]} {row[3]}" for row in chunk]
-
-        # Generate embeddings in batches
-        embeddings = generate_embedding(texts)  # Call the updated generate_embedding function
-        print(ids)               
-        # Update database
-        for id, embedding in zip(ids, embeddings):
-            cursor.execute("UPDATE tirukkural SET embeddings = ? WHERE kno = ?", (embedding.tobytes(), id))
-        
-        conn.commit()
-        
-        # Clear some memory
-        del embeddings, texts, ids
-        gc.collect()
-
-    # Close connection
-    conn.close()
-
-    print("Embedding generation complete.")
+    return list(embedding_backend.embed(texts))
+
+# Embed new or edited rows, streaming the table and resuming after interruptions
+@uses_db
+def generate_and_update_embeddings(restart=False):
+    from embedding_pipeline import update_embeddings
+    embedded = update_embeddings(conn, embedding_backend, restart=restart)
+    print(f"Embedding generation complete. {embedded} rows embedded.")
 
 # Call the function to execute the embedding generation and update process
 #generate_and_update_embeddings()
 
+# Function to fetch kural rows by kno, in the order the ids are given
+@uses_db
+def fetch_rows(ids, columns=("kno", "efirstline", "esecondline", "explanation")):
+    from instrumentation import ROW_FETCH, stage
+    if not ids:
+        return []
+    with stage(ROW_FETCH, rows=len(ids)):
+        cursor.execute("SELECT kno, {} FROM tirukkural WHERE kno IN ({})".format(', '.join(columns), ','.join('?' * len(ids))), list(ids))
+        rows_by_kno = {row[0]: row[1:] for row in cursor.fetchall()}
+    return [rows_by_kno[kno] for kno in ids if kno in rows_by_kno]
+
 # Function to fetch embeddings from the database
+@uses_db
 def fetch_embeddings():
-    cursor.execute("SELECT kno, embeddings FROM tirukkural WHERE embeddings IS NOT NULL")
-    rows = cursor.fetchall()
-    ids = [row[0] for row in rows]
-    embeddings = [np.frombuffer(row[1], dtype=np.float32) for row in rows]
+    from embedding_snapshot import decode_blobs
+    from instrumentation import DB_FETCH, DECODE, stage
+    with stage(DB_FETCH):
+        cursor.execute("SELECT kno, embeddings FROM tirukkural WHERE embeddings IS NOT NULL")
+        rows = cursor.fetchall()
+    with stage(DECODE, rows=len(rows)):
+        ids = [row[0] for row in rows]
+        embeddings = decode_blobs(row[1] for row in rows)
     return ids, embeddings
 
 # Function to find related rows based on cosine similarity
+@uses_db
 def find_related_rows(target_id, top_n=5):
-    # Fetch all embeddings
-    ids, embeddings = fetch_embeddings()
-    
-    # Find the target embedding
-    target_index = ids.index(target_id)
-    target_embedding = embeddings[target_index].reshape(1, -1)
-    
-    # Compute cosine similarity
-    similarities = cosine_similarity(target_embedding, embeddings).flatten()
-    
-    # Get the indices of the top_n most similar embeddings
-    related_indices = similarities.argsort()[-top_n-1:-1][::-1]
+    # Rank against the resident index instead of re-reading every embedding
+    related_ids = embedding_index.related(target_id, top_n)
     
     # Fetch the related rows
-    related_ids = [ids[i] for i in related_indices]
-    cursor.execute("SELECT kno, efirstline, esecondline, explanation FROM tirukkural WHERE kno IN ({})".format(','.join('?' * len(related_ids))), related_ids)
-    related_rows = cursor.fetchall()
+    related_rows = fetch_rows(related_ids)
     
     return related_rows
 
 # New function to query rows containing a specific word and find related rows
+@uses_db
 def query_and_find_related(word, top_n=5):
-    # Query the database for rows containing the word
-    cursor.execute("SELECT kno, efirstline, esecondline, explanation FROM tirukkural WHERE efirstline LIKE ? OR esecondline LIKE ? OR explanation LIKE ?", (f'%{word}%', f'%{word}%', f'%{word}%'))
-    rows = cursor.fetchmany(size=5)
+    from keyword_search import keyword_search
+    # Query the FTS index for the top_n most relevant rows containing the word
+    hits = [kno for kno, _ in keyword_search(conn, word, top_n)]
     
-    if not rows:
+    if not hits:
         print(f"No rows found containing the word '{word}'.")
         return []
     
-    # Generate embeddings for the queried rows if they don't already exist
-    ids = [row[0] for row in rows]
-    cursor.execute("SELECT kno, embeddings FROM tirukkural WHERE embeddings IS NOT NULL AND kno IN ({})".format(','.join('?' * len(ids))), ids)
-    rows_with_embeddings = cursor.fetchall()
-    ids_with_embeddings = [row[0] for row in rows_with_embeddings]
-    embeddings = [np.frombuffer(row[1], dtype=np.float32) for row in rows_with_embeddings]
-    
-    # Find related rows for each queried row
-    related_rows = []
-    for id, embedding in zip(ids_with_embeddings, embeddings):
-        related_rows.extend(find_related_rows(id, 1)) 
+    # Find the closest related row for every hit in one batched pass
+    hits = [kno for kno in hits if kno in embedding_index]
+    related_ids = [ids[0] for ids in embedding_index.related_many(hits, 1) if ids]
     
-    return related_rows
+    return fetch_rows(related_ids)
+
+# Function to rank kurals for a free-text query by keywords and meaning together
+@uses_db
+def hybrid_retrieve(query, top_n=5):
+    from keyword_search import hybrid_search
+    ranked = hybrid_search(conn, embedding_index, query, query_cache.embedding(query), top_n)
+    return fetch_rows([kno for kno, _ in ranked])
 
 # Example usage
 # word = "love"  # Replace with the word you want to query
@@ -143,114 +144,215 @@ def query_and_find_related(word, top_n=5):
 # for row in related_rows:
 #     print(row)
 
-# Function to update embeddings with new array column
-def update_embeddings_with_array():
-    # Fetch existing embeddings
-    cursor.execute("SELECT kno, embeddings FROM tirukkural WHERE embeddings IS NOT NULL")
-    rows = cursor.fetchall()
-    
-    # Convert existing embeddings to array format and update the new column
-    for row in rows:
-        kno = row[0]
-        embedding = np.frombuffer(row[1], dtype=np.float32)
-        cursor.execute("UPDATE tirukkural SET embeddings_array = ? WHERE kno = ?", (json.dumps(embedding.tolist()), kno))
-    
-    conn.commit()
-    print("Embeddings updated with new array column.")
+# Function to export embeddings to a compact memory-mapped snapshot.
+# This replaces the JSON copy that used to live in embeddings_array;
+# dtype may be "float32", "float16" or "int8".
+@uses_db
+def update_embeddings_with_array(dtype="float16"):
+    from embedding_snapshot import export_snapshot
+    export_snapshot(conn, snapshot_path, dtype)
+    print(f"Embeddings exported to {snapshot_path} as {dtype}.")
 
-# Call the function to update embeddings with new array column
+# Call the function to export the embeddings snapshot
 # update_embeddings_with_array()
 
-# Function to fetch embeddings from the embeddings_array column
+# Function to fetch embeddings from the snapshot as float32, falling back to
+# the embeddings column when the snapshot is missing or older than the database
+@uses_db
 def fetch_embeddings_from_array():
-    cursor.execute("SELECT kno, embeddings_array FROM tirukkural WHERE embeddings_array IS NOT NULL")
-    rows = cursor.fetchall()
-    ids = [row[0] for row in rows]
-    embeddings = [np.array(json.loads(row[1]), dtype=np.float32) for row in rows]
-    return ids, embeddings
+    from embedding_snapshot import EmbeddingSnapshot
+    if os.path.exists(snapshot_path):
+        snapshot = EmbeddingSnapshot(snapshot_path)
+        try:
+            if snapshot.is_current(conn):
+                return snapshot.ids.tolist(), snapshot.matrix()
+        finally:
+            snapshot.close()
+    return fetch_embeddings()
 
 # Function to find related rows based on cosine similarity using embeddings_array
+@uses_db
 def find_related_rows_from_array(target_id, top_n=5):
-    # Fetch all embeddings from the array column
-    ids, embeddings = fetch_embeddings()
-    
-    # Find the target embedding
-    target_index = ids.index(target_id)
-    target_embedding = embeddings[target_index].reshape(1, -1)
-    
-    # Compute cosine similarity
-    similarities = cosine_similarity(target_embedding, embeddings).flatten()
-    
-    # Get the indices of the top_n most similar embeddings
-    related_indices = similarities.argsort()[-top_n-1:-1][::-1]
-    
-    # Fetch the related IDs
-    related_ids = [ids[i] for i in related_indices]
-    
-    return related_ids  # Return a simple list of related IDs
-
-# Ensure the related_rows column exists
-# cursor.execute("ALTER TABLE tirukkural ADD COLUMN airelated_rows TEXT")  # Add this line to create the new column
-
-def update_related_rows():
-    for target_id in range(1, 1331):  # Loop from 1 to 1330
-        related_rows_from_array = find_related_rows_from_array(target_id, top_n=5)
-        
-        # Convert related rows to a simple array format suitable for storage
-        related_rows_json = json.dumps(related_rows_from_array)  # No extra array wrapping
-        
-        # Update the database with the related rows
-        cursor.execute("UPDATE tirukkural SET airelated_rows = ? WHERE kno = ?", (related_rows_json, target_id))
-        conn.commit()  # Commit the changes to the database
+    # Return a simple list of related IDs from the resident index
+    return embedding_index.related(target_id, top_n)
+
+# Precompute the related kurals for every embedded row in one pass.
+# Neighbours come from blocked matrix products over the resident index and
+# are written with a single executemany inside one transaction.
+@uses_db
+def update_related_rows(top_n=5, with_scores=False, memory_budget=64 * 1024 * 1024):
+    from embedding_pipeline import ensure_column
+    ensure_column(conn, "airelated_rows", "TEXT")
+    if with_scores:
+        ensure_column(conn, "airelated_scores", "TEXT")
+
+    updates = []
+    for ids, neighbours, scores in embedding_index.all_pairs(top_n, memory_budget):
+        for target_id, related_ids, related_scores in zip(ids.tolist(), neighbours.tolist(), scores.tolist()):
+            # Store a simple array of ids, plus the matching scores if requested
+            if with_scores:
+                rounded = [round(score, 6) for score in related_scores]
+                updates.append((json.dumps(related_ids), json.dumps(rounded), target_id))
+            else:
+                updates.append((json.dumps(related_ids), target_id))
+
+    with conn:
+        if with_scores:
+            conn.executemany("UPDATE tirukkural SET airelated_rows = ?, airelated_scores = ? WHERE kno = ?", updates)
+        else:
+            conn.executemany("UPDATE tirukkural SET airelated_rows = ? WHERE kno = ?", updates)
+    print(f"Related rows updated for {len(updates)} kurals.")
 
 # Call the function to update related rows
 # update_related_rows()  
 
 # Function to fetch relevant documents based on a query
+@uses_db
 def retrieve_documents(query, top_n=5):
-    # Fetch all embeddings
-    ids, embeddings = fetch_embeddings()
-    
-    # Generate embedding for the query
-    query_embedding = generate_embedding([query])[0].reshape(1, -1)
-    
-    # Compute cosine similarity
-    similarities = cosine_similarity(query_embedding, embeddings).flatten()
-    
-    # Get the indices of the top_n most similar embeddings
-    related_indices = similarities.argsort()[-top_n:][::-1]
+    # Embed and rank the query, reusing cached vectors and results
+    related_ids, _ = query_cache.search(query, top_n)
     
     # Fetch the related rows
-    related_ids = [ids[i] for i in related_indices]
-    cursor.execute("SELECT efirstline, esecondline, explanation FROM tirukkural WHERE kno IN ({})".format(','.join('?' * len(related_ids))), related_ids)
-    print(related_ids)
-    related_rows = cursor.fetchall()
+    related_rows = fetch_rows(related_ids, ("efirstline", "esecondline", "explanation"))
     
     return related_rows
 
-# Function to generate a response using OpenAI's API
+# Build the chunked approximate-nearest-neighbour index, one vector per commentary
+@uses_db
+def build_ann_index(path="commentary.ivf.npz", columns=None, n_lists=None):
+    from ann_index import CHUNK_COLUMNS, IVFIndex, build_chunk_index
+    index = build_chunk_index(conn, embedding_backend, IVFIndex(n_lists), columns or CHUNK_COLUMNS)
+    index.tune()
+    index.save(path)
+    print(f"ANN index with {len(index)} chunks in {index.n_lists} lists (n_probe={index.n_probe}) saved to {path}.")
+    return index
+
+# Loaded ANN indexes by path, reloaded only when the file changes
+ann_indexes = {}
+
+def load_ann_index(path):
+    from ann_index import IVFIndex
+    mtime = os.stat(path).st_mtime_ns
+    cached = ann_indexes.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = ann_indexes[path] = (mtime, IVFIndex.load(path))
+    return cached[1]
+
+# Function to fetch the kurals whose commentaries best match a query, via the ANN index
+@uses_db
+def ann_retrieve(query, path="commentary.ivf.npz", top_n=5, n_probe=None):
+    related_ids, _ = load_ann_index(path).search(query_cache.embedding(query), top_n, n_probe)
+    return fetch_rows(related_ids)
+
+# Function to generate a response with the configured chat backend
+@uses_db
 def generate_response(query, context):
-    prompt = f"Context: {context}\n\nQuestion: {query}\nAnswer:"
-    response = openai.ChatCompletion.create(
-        model="gpt-4o-mini",  # Use the appropriate model
-        messages=[{"role": "user", "content": prompt}]
-    )
-    return response['choices'][0]['message']['content']
+    from chat_backends import build_prompt
+    from instrumentation import LLM_CALL, stage
+    with stage(LLM_CALL, model=chat_backend.model):
+        return chat_backend.complete(build_prompt(query, context))
 
 # RAG function to combine retrieval and generation
-def rag_system(query):
-    # Retrieve relevant documents
-    documents = retrieve_documents(query)
+def rag_system(query, documents=None):
+    # Retrieve relevant documents, unless the caller already has them
+    if documents is None:
+        documents = retrieve_documents(query)
     
     # Combine the context from retrieved documents
-    context = "\n".join([" ".join(doc) for doc in documents])  # Combine efirstline, esecondline, and explanation
+    context = "\n".join([" ".join(str(value) for value in doc) for doc in documents])  # Combine efirstline, esecondline, and explanation
     
     # Generate a response based on the query and context
     response = generate_response(query, context)
     
     return response
 
+# Parse a KEY=VALUE command-line option; JSON values (numbers, booleans)
+# are decoded, anything else is kept as a string
+def parse_option(text):
+    key, sep, value = text.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got '{text}'")
+    try:
+        value = json.loads(value)
+    except ValueError:
+        pass
+    return key.replace("-", "_"), value
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Embedding, retrieval and RAG tools for the tirukkural database.")
+    parser.add_argument("--db", default=db_path, help="SQLite database path")
+    parser.add_argument("--backend", default="openai", help="embedding backend: openai, local or stub")
+    parser.add_argument("--backend-option", dest="backend_options", type=parse_option, action="append", default=[],
+                        metavar="KEY=VALUE", help="embedding backend setting, e.g. dim=384 for stub; repeatable")
+    parser.add_argument("--chat", default="openai", help="chat backend: openai or stub")
+    parser.add_argument("--chat-api-base", help="OpenAI-compatible chat endpoint")
+    parser.add_argument("--timings", action="store_true", help="print per-stage timings when done")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    embed = commands.add_parser("embed", help="embed new or edited rows")
+    embed.add_argument("--restart", action="store_true", help="ignore the checkpoint and rescan every row")
+
+    related = commands.add_parser("precompute-related", help="rebuild the airelated_rows column")
+    related.add_argument("--top-n", type=int, default=5)
+    related.add_argument("--with-scores", action="store_true", help="also store similarity scores")
+
+    search = commands.add_parser("search", help="find kurals for a question")
+    search.add_argument("query")
+    search.add_argument("--top-n", type=int, default=5)
+    search.add_argument("--hybrid", action="store_true", help="fuse keyword and vector rankings")
+    search.add_argument("--ann", metavar="PATH", help="search chunked commentaries through this ANN index")
+    search.add_argument("--n-probe", type=int, help="IVF lists scanned per query (default: tuned when the index was built)")
+    search.add_argument("--answer", action="store_true", help="also generate an answer from the results")
+
+    ann = commands.add_parser("build-ann", help="embed every commentary separately into an IVF index")
+    ann.add_argument("--out", default="commentary.ivf.npz")
+    ann.add_argument("--columns", nargs="+", help="commentary columns to embed")
+    ann.add_argument("--lists", type=int, help="number of IVF lists (default 4*sqrt(chunks))")
+
+    server = commands.add_parser("serve", help="run the retrieval/RAG HTTP service")
+    server.add_argument("--host", default="127.0.0.1")
+    server.add_argument("--port", type=int, default=8000)
+    server.add_argument("--max-batch", type=int, default=32, help="most queries coalesced into one batch")
+    server.add_argument("--max-wait-ms", type=float, default=5.0, help="how long a batch waits to fill")
+    server.add_argument("--llm-concurrency", type=int, default=8, help="most chat calls in flight at once")
+    server.add_argument("--snapshot", metavar="PATH", help="search this embedding snapshot while it matches the database")
+
+    args = parser.parse_args(argv)
+    if args.timings:
+        from instrumentation import StatsSink, add_sink
+        timings = add_sink(StatsSink())
+    chat_options = {"api_base": args.chat_api_base} if args.chat_api_base else {}
+
+    connect(args.db, args.backend, args.chat, dict(args.backend_options), chat_options)
+    if args.command == "serve":
+        from rag_service import RetrievalService, serve
+
+        service = RetrievalService(
+            db_path, embedding_backend, chat_backend,
+            args.max_batch, args.max_wait_ms / 1000, args.llm_concurrency, args.snapshot,
+        ).warm()
+        serve(service, args.host, args.port)
+    elif args.command == "embed":
+        generate_and_update_embeddings(args.restart)
+    elif args.command == "precompute-related":
+        update_related_rows(args.top_n, args.with_scores)
+    elif args.command == "build-ann":
+        build_ann_index(args.out, args.columns, args.lists)
+    elif args.command == "search":
+        if args.ann:
+            rows = ann_retrieve(args.query, args.ann, args.top_n, args.n_probe)
+        elif args.hybrid:
+            rows = hybrid_retrieve(args.query, args.top_n)
+        else:
+            rows = retrieve_documents(args.query, args.top_n)
+        for row in rows:
+            print(row)
+        if args.answer:
+            print(rag_system(args.query, rows))
+    if args.timings:
+        print(timings.summary())
+
 # Example usage
-query = "What is marriage's significance on getting wisdom?"  # Replace with the user's query
-response = rag_system(query)
-print(response)
+# python embedd.py search "What is marriage's significance on getting wisdom?" --answer
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import hashlib
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from instrumentation import EMBED_CALL, stage
+
+
+# OpenAI error classes worth retrying: rate limits, timeouts, dropped
+# connections and server-side failures. Names cover openai<1.0 (openai.error)
+# and the newer top-level exceptions; whichever exist are used.
+TRANSIENT_ERROR_NAMES = (
+    "RateLimitError", "Timeout", "APITimeoutError", "APIConnectionError",
+    "ServiceUnavailableError", "TryAgain", "InternalServerError",
+)
+
+
+def _transient_errors():
+    errors = [TimeoutError, ConnectionError]
+    try:
+        import openai
+    except ImportError:
+        return tuple(errors)
+    for module in (getattr(openai, "error", None), openai):
+        for name in TRANSIENT_ERROR_NAMES:
+            error = getattr(module, name, None)
+            if isinstance(error, type) and issubclass(error, BaseException):
+                errors.append(error)
+    return tuple(errors)
+
+
+# True for errors a retry may fix; anything else (bad request, auth,
+# invalid input) is raised straight away.
+def is_transient(exc):
+    if isinstance(exc, _transient_errors()):
+        return True
+    status = getattr(exc, "http_status", None) or getattr(exc, "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+# Call fn(), retrying transient failures with exponential backoff and jitter.
+def with_retries(fn, max_retries=5, backoff=1.0, max_backoff=30.0, retry_on=is_transient):
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except Exception as exc:
+            if attempt == max_retries or not retry_on(exc):
+                raise
+            delay = min(max_backoff, backoff * (2 ** attempt))
+            time.sleep(delay * (0.5 + random.random() / 2))
+
+
+class EmbeddingBackend:
+    """Turns a list of texts into a float32 matrix with one row per text."""
+
+    model = None
+    batch_size = 100
+
+    def embed_batch(self, texts):
+        raise NotImplementedError
+
+    def embed(self, texts):
+        texts = list(texts)
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        with stage(EMBED_CALL, model=self.model, texts=len(texts)):
+            return np.vstack(self._map(batches)).astype(np.float32, copy=False)
+
+    # Embed each batch, in order; subclasses may run batches concurrently
+    def _map(self, batches):
+        return [self.embed_batch(batch) for batch in batches]
+
+
+class OpenAIBackend(EmbeddingBackend):
+    """OpenAI embeddings, many inputs per request, several requests in flight."""
+
+    def __init__(self, model="text-embedding-ada-002", batch_size=100, max_workers=4, max_retries=5, backoff=1.0):
+        self.model = model
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    def embed_batch(self, texts):
+        import openai
+
+        def request():
+            return openai.Embedding.create(model=self.model, input=texts)
+
+        response = with_retries(request, self.max_retries, self.backoff)
+        # The API may return items out of order; put them back by index
+        data = sorted(response["data"], key=lambda item: item["index"])
+        return np.array([item["embedding"] for item in data], dtype=np.float32)
+
+    # Several requests in flight at once; pool.map keeps batch order
+    def _map(self, batches):
+        if len(batches) == 1 or self.max_workers <= 1:
+            return super()._map(batches)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            return list(pool.map(self.embed_batch, batches))
+
+
+class LocalBackend(EmbeddingBackend):
+    """Sentence-transformers model run on CPU (or GPU) with mean pooling."""
+
+    def __init__(self, model="sentence-transformers/all-MiniLM-L6-v2", batch_size=32, device=None):
+        self.model = model
+        self.batch_size = batch_size
+        self.device = device
+        self._tokenizer = None
+        self._model = None
+
+    def _load(self):
+        if self._model is None:
+            import torch
+            from transformers import AutoTokenizer, AutoModel
+
+            self._tokenizer = AutoTokenizer.from_pretrained(self.model)
+            if self._tokenizer.pad_token is None:
+                self._tokenizer.pad_token = self._tokenizer.eos_token
+            if self.device is None:
+                self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            self._model = AutoModel.from_pretrained(self.model).to(self.device)
+            self._model.eval()
+        return self._tokenizer, self._model
+
+    def embed_batch(self, texts):
+        import torch
+
+        tokenizer, model = self._load()
+        inputs = tokenizer(texts, padding=True, truncation=True, return_tensors="pt").to(self.device)
+        with torch.no_grad():
+            hidden = model(**inputs).last_hidden_state
+        # Mean-pool over real tokens only, ignoring the padding
+        mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+        pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+        return pooled.cpu().numpy().astype(np.float32)
+
+
+class StubBackend(EmbeddingBackend):
+    """Deterministic offline vectors derived from a hash of each text."""
+
+    def __init__(self, dim=1536, model="stub", batch_size=1000):
+        self.dim = dim
+        self.model = f"{model}-{dim}"
+        self.batch_size = batch_size
+
+    def embed_batch(self, texts):
+        rows = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+            rows.append(np.random.default_rng(seed).standard_normal(self.dim, dtype=np.float32))
+        return np.array(rows, dtype=np.float32)
+
+
+BACKENDS = {
+    "openai": OpenAIBackend,
+    "local": LocalBackend,
+    "stub": StubBackend,
+}
+
+
+# Build a backend by name, e.g. get_backend("stub", dim=384)
+def get_backend(name="openai", **kwargs):
+    try:
+        return BACKENDS[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown embedding backend '{name}', expected one of {sorted(BACKENDS)}") from None
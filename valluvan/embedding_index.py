@@ -0,0 +1,238 @@
+import sqlite3
+import time
+
+import numpy as np
+
+from instrumentation import DB_FETCH, DECODE, SIMILARITY, record, stage
+
+
+# Pick the k largest scores from a 1-D or 2-D score array, best first.
+# argpartition keeps this O(n) per row instead of a full argsort. With
+# overwrite=True the scores are negated in place rather than copied, which
+# leaves the int64 argpartition result as the only full-size allocation.
+def top_k(scores, k, overwrite=False):
+    scores = np.asarray(scores)
+    n = scores.shape[-1]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(scores.shape[:-1] + (0,), dtype=np.int64)
+    negated = np.negative(scores, out=scores if overwrite else None)
+    if k < n:
+        candidates = np.argpartition(negated, k - 1, axis=-1)[..., :k]
+    else:
+        candidates = np.broadcast_to(np.arange(n), scores.shape).copy()
+    order = np.argsort(np.take_along_axis(negated, candidates, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=-1)
+
+
+# L2-normalise the rows of a matrix in place; all-zero rows stay zero.
+def normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+# A generation counter bumped by triggers whenever the embeddings column
+# changes. Unlike PRAGMA data_version it ignores writes to other columns
+# and tables (query_cache, FTS, progress), so those do not force a reload.
+GENERATION_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embedding_generation (id INTEGER PRIMARY KEY CHECK (id = 1), generation INTEGER NOT NULL);
+INSERT OR IGNORE INTO embedding_generation (id, generation) VALUES (1, 0);
+CREATE TRIGGER IF NOT EXISTS {table}_{column}_update AFTER UPDATE OF {column} ON {table}
+BEGIN UPDATE embedding_generation SET generation = generation + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS {table}_{column}_insert AFTER INSERT ON {table} WHEN NEW.{column} IS NOT NULL
+BEGIN UPDATE embedding_generation SET generation = generation + 1 WHERE id = 1; END;
+CREATE TRIGGER IF NOT EXISTS {table}_{column}_delete AFTER DELETE ON {table} WHEN OLD.{column} IS NOT NULL
+BEGIN UPDATE embedding_generation SET generation = generation + 1 WHERE id = 1; END;
+"""
+
+
+def ensure_generation_counter(conn, table="tirukkural", column="embeddings"):
+    conn.executescript(GENERATION_SCHEMA.format(table=table, column=column))
+    conn.commit()
+
+
+# Current embeddings generation, or None if the counter is not installed
+def embeddings_generation(conn):
+    try:
+        return conn.execute("SELECT generation FROM embedding_generation WHERE id = 1").fetchone()[0]
+    except sqlite3.OperationalError:
+        return None
+
+
+# Working memory per (row, candidate) pair in all_pairs: a float32 score
+# and an int64 argpartition index
+BYTES_PER_PAIR = 4 + 8
+
+
+class EmbeddingIndex:
+    """Resident, L2-normalised copy of the tirukkural embeddings column.
+
+    The column is read once into a contiguous float32 matrix and is only
+    re-read when the database reports a change, so similarity lookups cost
+    one matrix-vector product instead of a full table scan and decode.
+    """
+
+    def __init__(self, conn, table="tirukkural", column="embeddings"):
+        self.conn = conn
+        self.table = table
+        self.column = column
+        self.ids = np.empty(0, dtype=np.int64)
+        self.matrix = np.empty((0, 0), dtype=np.float32)
+        self._positions = {}
+        self._version = None
+        try:
+            ensure_generation_counter(conn, table, column)
+        except sqlite3.OperationalError:
+            # Missing table or read-only connection: fall back to data_version
+            pass
+
+    def __len__(self):
+        self.refresh()
+        return len(self.ids)
+
+    def __contains__(self, kno):
+        self.refresh()
+        return int(kno) in self._positions
+
+    # Prefer the embedding_generation counter so unrelated writes do not
+    # force a reload. Without it, PRAGMA data_version moves when another
+    # connection commits and total_changes covers writes made through our
+    # own connection.
+    def _current_version(self):
+        generation = embeddings_generation(self.conn)
+        if generation is not None:
+            return ("generation", generation)
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return (data_version, self.conn.total_changes)
+
+    def load(self, page_size=1024):
+        version = self._current_version()
+        count = self.conn.execute(
+            f"SELECT COUNT(*) FROM {self.table} WHERE {self.column} IS NOT NULL"
+        ).fetchone()[0]
+        rows = self.conn.execute(
+            f"SELECT kno, {self.column} FROM {self.table} WHERE {self.column} IS NOT NULL ORDER BY kno"
+        )
+
+        ids = np.empty(count, dtype=np.int64)
+        matrix = None
+        filled = 0
+        fetch_seconds = decode_seconds = 0.0
+        while filled < count:
+            started = time.perf_counter()
+            page = rows.fetchmany(page_size)
+            fetched = time.perf_counter()
+            fetch_seconds += fetched - started
+            if not page:
+                break
+            for kno, blob in page[:count - filled]:
+                vector = np.frombuffer(blob, dtype=np.float32)
+                if matrix is None:
+                    matrix = np.empty((count, vector.shape[0]), dtype=np.float32)
+                elif vector.shape[0] != matrix.shape[1]:
+                    raise ValueError(
+                        f"Embedding for kno {kno} has {vector.shape[0]} dimensions, expected {matrix.shape[1]}"
+                    )
+                ids[filled] = kno
+                matrix[filled] = vector
+                filled += 1
+            decode_seconds += time.perf_counter() - fetched
+
+        if matrix is None:
+            matrix = np.empty((0, 0), dtype=np.float32)
+        started = time.perf_counter()
+        self.ids = ids[:filled]
+        self.matrix = normalize_rows(matrix[:filled])
+        self._positions = {int(kno): i for i, kno in enumerate(self.ids)}
+        self._version = version
+        record(DB_FETCH, fetch_seconds, rows=filled)
+        record(DECODE, decode_seconds + time.perf_counter() - started, rows=filled)
+        return self
+
+    # Reload only if the table changed since the last load.
+    def refresh(self):
+        if self._version != self._current_version():
+            self.load()
+        return self
+
+    def position(self, kno):
+        self.refresh()
+        try:
+            return self._positions[int(kno)]
+        except KeyError:
+            raise KeyError(f"No embedding stored for kno {kno}") from None
+
+    def vector(self, kno):
+        position = self.position(kno)
+        return self.matrix[position]
+
+    # Return (ids, scores) of the top_n rows most similar to a query vector.
+    def search(self, query, top_n=5, exclude=None):
+        self.refresh()
+        if not len(self.ids):
+            return [], []
+        with stage(SIMILARITY, rows=len(self.ids), queries=1):
+            query = np.asarray(query, dtype=np.float32).reshape(-1)
+            norm = np.linalg.norm(query)
+            if norm:
+                query = query / norm
+            scores = self.matrix @ query
+            if exclude is not None and int(exclude) in self._positions:
+                scores[self._positions[int(exclude)]] = -np.inf
+                top_n = min(top_n, len(scores) - 1)
+            best = top_k(scores, top_n)
+            return self.ids[best].tolist(), scores[best].tolist()
+
+    # Top-k for several query vectors at once, from one matrix product.
+    # Returns a list of (ids, scores), one per query.
+    def search_many(self, queries, top_n=5):
+        self.refresh()
+        if not len(self.ids):
+            return [([], []) for _ in queries]
+        with stage(SIMILARITY, rows=len(self.ids), queries=len(queries)):
+            queries = normalize_rows(np.array(queries, dtype=np.float32, ndmin=2))
+            scores = queries @ self.matrix.T
+            best = top_k(scores, top_n)
+            best_scores = np.take_along_axis(scores, best, axis=1)
+            return list(zip(self.ids[best].tolist(), best_scores.tolist()))
+
+    # Yield (ids, neighbour_ids, scores) for every stored kural, block by block.
+    # Each block is one normalised matrix product sized so that its float32
+    # scores plus the int64 argpartition indices stay within memory_budget.
+    def all_pairs(self, top_n=5, memory_budget=64 * 1024 * 1024):
+        self.refresh()
+        n = len(self.ids)
+        if not n:
+            return
+        top_n = min(top_n, n - 1)
+        block_rows = max(1, memory_budget // (BYTES_PER_PAIR * n))
+        for start in range(0, n, block_rows):
+            stop = min(start + block_rows, n)
+            with stage(SIMILARITY, rows=n, queries=stop - start):
+                scores = self.matrix[start:stop] @ self.matrix.T
+                scores[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+                best = top_k(scores, top_n, overwrite=True)
+            # top_k left the block negated; flip only the selected scores back
+            yield (
+                self.ids[start:stop],
+                self.ids[best],
+                -np.take_along_axis(scores, best, axis=1),
+            )
+
+    # Related ids for several kurals at once, from one matrix product.
+    def related_many(self, knos, top_n=5):
+        positions = [self.position(kno) for kno in knos]
+        if not positions:
+            return []
+        top_n = min(top_n, len(self.ids) - 1)
+        with stage(SIMILARITY, rows=len(self.ids), queries=len(positions)):
+            scores = self.matrix[positions] @ self.matrix.T
+            scores[np.arange(len(positions)), positions] = -np.inf
+            return self.ids[top_k(scores, top_n)].tolist()
+
+    # Return the ids of the top_n kurals most similar to an existing kural.
+    def related(self, kno, top_n=5):
+        ids, _ = self.search(self.vector(kno), top_n, exclude=kno)
+        return ids
@@ -0,0 +1,90 @@
+import hashlib
+
+import numpy as np
+
+
+TEXT_COLUMNS = ("efirstline", "esecondline", "explanation")
+
+
+# Add a column to a table unless it is already there
+def ensure_column(conn, name, column_type, table="tirukkural"):
+    columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+    if name not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+
+
+def ensure_pipeline_schema(conn):
+    ensure_column(conn, "embedding_hash", "TEXT")
+    ensure_column(conn, "embedding_model", "TEXT")
+    conn.execute("CREATE TABLE IF NOT EXISTS embedding_progress (model TEXT PRIMARY KEY, last_kno INTEGER NOT NULL)")
+    conn.commit()
+
+
+# The text we embed for a kural, and the hash used to spot edits to it
+def embedding_text(efirstline, esecondline, explanation):
+    return f"{efirstline} {esecondline} {explanation}"
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Stream rows in kno order one page at a time, starting after after_kno.
+# Keyset pagination keeps memory flat and lets us write between pages.
+def stream_rows(conn, after_kno=0, page_size=500):
+    columns = ", ".join(TEXT_COLUMNS)
+    while True:
+        page = conn.execute(
+            f"SELECT kno, {columns}, embedding_hash, embedding_model, embeddings IS NULL "
+            f"FROM tirukkural WHERE kno > ? ORDER BY kno LIMIT ?",
+            (after_kno, page_size),
+        ).fetchall()
+        if not page:
+            return
+        yield page
+        after_kno = page[-1][0]
+
+
+def load_checkpoint(conn, model):
+    row = conn.execute("SELECT last_kno FROM embedding_progress WHERE model = ?", (model,)).fetchone()
+    return row[0] if row else 0
+
+
+# Embed only rows whose text or model changed since they were last embedded.
+# Progress is checkpointed per page, so an interrupted run resumes where it
+# stopped; pass restart=True to rescan from the first kural.
+def update_embeddings(conn, backend, page_size=500, restart=False):
+    conn.execute("PRAGMA journal_mode=WAL")
+    ensure_pipeline_schema(conn)
+
+    model = backend.model
+    after_kno = 0 if restart else load_checkpoint(conn, model)
+    embedded = 0
+    for page in stream_rows(conn, after_kno, page_size):
+        ids, texts, hashes = [], [], []
+        for kno, efirstline, esecondline, explanation, stored_hash, stored_model, missing in page:
+            text = embedding_text(efirstline, esecondline, explanation)
+            digest = content_hash(text)
+            if missing or digest != stored_hash or model != stored_model:
+                ids.append(kno)
+                texts.append(text)
+                hashes.append(digest)
+
+        embeddings = backend.embed(texts) if texts else np.empty((0, 0), dtype=np.float32)
+        with conn:
+            conn.executemany(
+                "UPDATE tirukkural SET embeddings = ?, embedding_hash = ?, embedding_model = ? WHERE kno = ?",
+                [(np.asarray(embedding, dtype=np.float32).tobytes(), digest, model, kno)
+                 for kno, embedding, digest in zip(ids, embeddings, hashes)],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO embedding_progress (model, last_kno) VALUES (?, ?)",
+                (model, page[-1][0]),
+            )
+        embedded += len(ids)
+        print(f"Embedded {len(ids)} of {len(page)} rows up to kno {page[-1][0]}")
+
+    # A finished run clears its checkpoint so the next run rescans for edits
+    with conn:
+        conn.execute("DELETE FROM embedding_progress WHERE model = ?", (model,))
+    return embedded
@@ -0,0 +1,257 @@
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from embedding_index import EmbeddingIndex, embeddings_generation, normalize_rows, top_k
+from instrumentation import SIMILARITY, stage
+
+
+# Snapshot layout (little-endian), every section aligned to ALIGNMENT bytes:
+#   header   MAGIC, version, dtype code, count, dim, embeddings generation,
+#            then section offsets
+#   ids      int64[count]           kno of each row
+#   scales   float32[count]         per-row dequantisation scale (int8 only)
+#   vectors  dtype[count, dim]      L2-normalised rows, possibly quantised
+MAGIC = b"VLVNEMB1"
+VERSION = 2
+ALIGNMENT = 64
+HEADER = struct.Struct("<8sIIQIQQQQ")
+DTYPES = {"float32": (0, np.dtype("<f4")), "float16": (1, np.dtype("<f2")), "int8": (2, np.dtype("i1"))}
+DTYPE_NAMES = {code: name for name, (code, _) in DTYPES.items()}
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+# Decode many float32 BLOBs at once: one join and one frombuffer instead of
+# a Python-level decode per row.
+def decode_blobs(blobs, dtype=np.float32):
+    blobs = list(blobs)
+    if not blobs:
+        return np.empty((0, 0), dtype=dtype)
+    return np.frombuffer(b"".join(blobs), dtype=dtype).reshape(len(blobs), -1)
+
+
+# Quantise normalised float32 rows; int8 rows get a per-row scale
+def quantize(rows, dtype="float32"):
+    if dtype == "int8":
+        scales = np.abs(rows).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        values = np.rint(rows / scales[:, None]).astype(np.int8)
+        return values, scales.astype(np.float32)
+    return rows.astype(DTYPES[dtype][1]), None
+
+
+# Write rows to a snapshot file. generation is the embeddings generation the
+# rows were read at, so readers can tell when the snapshot has gone stale.
+def write_snapshot(path, ids, matrix, dtype="float32", block_rows=65536, generation=0):
+    if dtype not in DTYPES:
+        raise ValueError(f"Unsupported snapshot dtype '{dtype}', expected one of {sorted(DTYPES)}")
+    code, np_dtype = DTYPES[dtype]
+    ids = np.asarray(ids, dtype="<i8")
+    count = len(ids)
+    dim = matrix.shape[1] if count else 0
+
+    ids_offset = _align(HEADER.size)
+    scales_offset = _align(ids_offset + ids.nbytes)
+    vectors_offset = _align(scales_offset + (4 * count if dtype == "int8" else 0))
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, code, count, dim, generation, ids_offset, scales_offset, vectors_offset))
+        f.seek(ids_offset)
+        f.write(ids.tobytes())
+        for start in range(0, count, block_rows):
+            rows = normalize_rows(np.array(matrix[start:start + block_rows], dtype=np.float32))
+            values, scales = quantize(rows, dtype)
+            if scales is not None:
+                f.seek(scales_offset + 4 * start)
+                f.write(scales.astype("<f4").tobytes())
+            f.seek(vectors_offset + start * dim * np_dtype.itemsize)
+            f.write(values.tobytes())
+        f.truncate(vectors_offset + count * dim * np_dtype.itemsize)
+    return path
+
+
+# Export the embeddings column of a database to a snapshot file
+def export_snapshot(conn, path, dtype="float32"):
+    index = EmbeddingIndex(conn)
+    # Read the generation first: a write racing the load leaves the snapshot
+    # looking stale rather than looking current
+    generation = embeddings_generation(conn) or 0
+    index.load()
+    return write_snapshot(path, index.ids, index.matrix, dtype, generation=generation)
+
+
+class EmbeddingSnapshot:
+    """Read-only, memory-mapped view of a snapshot file.
+
+    Vectors are searched straight from the mapping in blocks, so processes
+    that open the same file share one page-cached copy of the data.
+    """
+
+    def __init__(self, path, block_rows=65536):
+        self.path = path
+        self.block_rows = block_rows
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, code, count, dim, self.generation, ids_offset, scales_offset,
+         vectors_offset) = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} embedding snapshot")
+        self.dtype = DTYPE_NAMES[code]
+        self.ids = np.frombuffer(self._mmap, dtype="<i8", count=count, offset=ids_offset)
+        self.scales = (np.frombuffer(self._mmap, dtype="<f4", count=count, offset=scales_offset)
+                       if self.dtype == "int8" else None)
+        self.vectors = np.frombuffer(self._mmap, dtype=DTYPES[self.dtype][1], count=count * dim,
+                                     offset=vectors_offset).reshape(count, dim)
+        self._positions = {int(kno): i for i, kno in enumerate(self.ids)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def close(self):
+        self.ids = self.scales = self.vectors = None
+        self._mmap.close()
+
+    # True while the database embeddings are the ones this snapshot was
+    # exported from
+    def is_current(self, conn):
+        return embeddings_generation(conn) == self.generation
+
+    # All rows as dequantised float32, copied out of the mapping
+    def matrix(self):
+        matrix = self.vectors.astype(np.float32)
+        if self.scales is not None:
+            matrix *= self.scales[:, None]
+        return matrix
+
+    def position(self, kno):
+        try:
+            return self._positions[int(kno)]
+        except KeyError:
+            raise KeyError(f"No embedding stored for kno {kno}") from None
+
+    def vector(self, kno):
+        position = self.position(kno)
+        row = self.vectors[position].astype(np.float32)
+        if self.scales is not None:
+            row *= self.scales[position]
+        return row
+
+    # Cosine scores of every row against a query, computed block by block
+    def scores(self, query):
+        query = np.asarray(query, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+        scores = np.empty(len(self.ids), dtype=np.float32)
+        for start in range(0, len(self.ids), self.block_rows):
+            stop = start + self.block_rows
+            block = self.vectors[start:stop]
+            if block.dtype != np.float32:
+                block = block.astype(np.float32)
+            scores[start:stop] = block @ query
+        if self.scales is not None:
+            scores *= self.scales
+        return scores
+
+    # Return (ids, scores) of the top_n rows most similar to a query vector
+    def search(self, query, top_n=5, exclude=None):
+        if not len(self.ids):
+            return [], []
+        with stage(SIMILARITY, rows=len(self.ids), queries=1, dtype=self.dtype):
+            scores = self.scores(query)
+            if exclude is not None and int(exclude) in self._positions:
+                scores[self._positions[int(exclude)]] = -np.inf
+                top_n = min(top_n, len(scores) - 1)
+            best = top_k(scores, top_n)
+            return self.ids[best].tolist(), scores[best].tolist()
+
+    # Top-k for several query vectors at once; returns a list of (ids, scores)
+    def search_many(self, queries, top_n=5):
+        if not len(self.ids):
+            return [([], []) for _ in queries]
+        with stage(SIMILARITY, rows=len(self.ids), queries=len(queries), dtype=self.dtype):
+            queries = normalize_rows(np.array(queries, dtype=np.float32, ndmin=2))
+            scores = np.empty((len(queries), len(self.ids)), dtype=np.float32)
+            for start in range(0, len(self.ids), self.block_rows):
+                stop = start + self.block_rows
+                block = self.vectors[start:stop]
+                if block.dtype != np.float32:
+                    block = block.astype(np.float32)
+                scores[:, start:stop] = queries @ block.T
+            if self.scales is not None:
+                scores *= self.scales
+            best = top_k(scores, top_n)
+            best_scores = np.take_along_axis(scores, best, axis=1)
+            return list(zip(self.ids[best].tolist(), best_scores.tolist()))
+
+    def related(self, kno, top_n=5):
+        ids, _ = self.search(self.vector(kno), top_n, exclude=kno)
+        return ids
+
+
+class SnapshotIndex:
+    """Searches a snapshot file while it matches the database.
+
+    Drop-in for EmbeddingIndex in QueryCache and RetrievalService. The
+    snapshot is reopened when the file is re-exported; while it is missing
+    or stale, searches fall back to a resident EmbeddingIndex. Like
+    EmbeddingIndex it is meant for one thread; ids holds the rows of the
+    last source searched and is safe to read from others.
+    """
+
+    def __init__(self, conn, path, table="tirukkural", column="embeddings"):
+        self.conn = conn
+        self.path = path
+        self.table = table
+        self.column = column
+        self.fallback = EmbeddingIndex(conn, table, column)
+        self.snapshot = None
+        self.ids = np.empty(0, dtype=np.int64)
+        self._mtime = None
+
+    # A replaced snapshot is dropped, not closed: numpy views of its mapping
+    # may still be alive, and the mapping is released with the last of them.
+    def _open(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if mtime != self._mtime:
+            self.snapshot, self._mtime = EmbeddingSnapshot(self.path), mtime
+        return self.snapshot
+
+    # The snapshot if it is current, otherwise the refreshed fallback index
+    def current(self):
+        snapshot = self.snapshot
+        if snapshot is None or not snapshot.is_current(self.conn):
+            snapshot = self._open()
+        source = snapshot if snapshot is not None and snapshot.is_current(self.conn) else self.fallback.refresh()
+        self.ids = source.ids
+        return source
+
+    def __len__(self):
+        return len(self.current())
+
+    def load(self):
+        self.current()
+        return self
+
+    def refresh(self):
+        return self.load()
+
+    def search(self, query, top_n=5, exclude=None):
+        return self.current().search(query, top_n, exclude)
+
+    def search_many(self, queries, top_n=5):
+        return self.current().search_many(queries, top_n)
+
+    def related(self, kno, top_n=5):
+        return self.current().related(kno, top_n)
+
+    def close(self):
+        self.snapshot = self._mtime = None
@@ -0,0 +1,80 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Stage names emitted by the pipeline
+DB_FETCH = "db_fetch"
+DECODE = "decode"
+EMBED_CALL = "embed_call"
+SIMILARITY = "similarity"
+KEYWORD_SEARCH = "keyword_search"
+ROW_FETCH = "row_fetch"
+LLM_CALL = "llm_call"
+
+_sinks = []
+
+
+# A sink is any callable taking (stage, seconds, fields)
+def add_sink(sink):
+    _sinks.append(sink)
+    return sink
+
+
+def remove_sink(sink):
+    if sink in _sinks:
+        _sinks.remove(sink)
+
+
+def record(name, seconds, **fields):
+    for sink in list(_sinks):
+        sink(name, seconds, fields)
+
+
+# Time a block and report it to every sink; free when no sink is installed
+@contextmanager
+def stage(name, **fields):
+    if not _sinks:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - started, **fields)
+
+
+class StatsSink:
+    """Aggregates count, total and max seconds per stage."""
+
+    def __init__(self):
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, name, seconds, fields):
+        with self._lock:
+            entry = self.stats.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+
+    def reset(self):
+        with self._lock:
+            self.stats.clear()
+
+    def summary(self):
+        lines = [f"{'stage':<16}{'calls':>8}{'total ms':>12}{'mean ms':>10}{'max ms':>10}"]
+        for name, entry in sorted(self.stats.items(), key=lambda item: -item[1]["total"]):
+            lines.append(
+                f"{name:<16}{entry['count']:>8}{1000 * entry['total']:>12.2f}"
+                f"{1000 * entry['total'] / entry['count']:>10.3f}{1000 * entry['max']:>10.3f}"
+            )
+        return "\n".join(lines)
+
+
+class PrintSink:
+    """Prints one line per timed stage."""
+
+    def __call__(self, name, seconds, fields):
+        details = " ".join(f"{key}={value}" for key, value in fields.items())
+        print(f"[{name}] {1000 * seconds:.2f} ms {details}".rstrip())
@@ -0,0 +1,108 @@
+import itertools
+import unicodedata
+
+from instrumentation import KEYWORD_SEARCH, stage
+
+
+# Text columns worth indexing, in order; only those present in the table are used
+SEARCH_COLUMNS = (
+    "efirstline", "esecondline", "explanation", "firstline", "secondline",
+    "manakudavar", "parimelazhagar", "varadarajanar", "kalaignar", "salomon",
+    "munisamy", "puliur", "devaneya", "namakkal", "tamilkuzavi",
+)
+
+# Keep Tamil vowel signs (Unicode category M*) inside tokens instead of
+# treating them as separators
+TOKENIZER = "unicode61 remove_diacritics 2 categories 'L* N* Co M*'"
+
+
+def indexed_columns(conn, table="tirukkural"):
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    return [column for column in SEARCH_COLUMNS if column in existing]
+
+
+# Create the tirukkural_fts shadow index and the triggers that keep it in
+# sync. The index is rebuilt if it is new or its column set has changed.
+def ensure_fts_index(conn):
+    columns = indexed_columns(conn)
+    current = [row[1] for row in conn.execute("PRAGMA table_info(tirukkural_fts)")]
+    if current == columns:
+        return columns
+
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    with conn:
+        conn.executescript(f"""
+            DROP TRIGGER IF EXISTS tirukkural_fts_insert;
+            DROP TRIGGER IF EXISTS tirukkural_fts_delete;
+            DROP TRIGGER IF EXISTS tirukkural_fts_update;
+            DROP TABLE IF EXISTS tirukkural_fts;
+            CREATE VIRTUAL TABLE tirukkural_fts USING fts5(
+                {column_list}, content='tirukkural', content_rowid='kno', tokenize="{TOKENIZER}"
+            );
+            CREATE TRIGGER tirukkural_fts_insert AFTER INSERT ON tirukkural BEGIN
+                INSERT INTO tirukkural_fts (rowid, {column_list}) VALUES (new.kno, {new_values});
+            END;
+            CREATE TRIGGER tirukkural_fts_delete AFTER DELETE ON tirukkural BEGIN
+                INSERT INTO tirukkural_fts (tirukkural_fts, rowid, {column_list}) VALUES ('delete', old.kno, {old_values});
+            END;
+            CREATE TRIGGER tirukkural_fts_update AFTER UPDATE OF {column_list} ON tirukkural BEGIN
+                INSERT INTO tirukkural_fts (tirukkural_fts, rowid, {column_list}) VALUES ('delete', old.kno, {old_values});
+                INSERT INTO tirukkural_fts (rowid, {column_list}) VALUES (new.kno, {new_values});
+            END;
+            INSERT INTO tirukkural_fts (tirukkural_fts) VALUES ('rebuild');
+        """)
+    return columns
+
+
+# Same token characters as TOKENIZER. Python's \w excludes the Mc/Mn vowel
+# signs, which would cut Tamil words into fragments that match unrelated rows.
+def _is_token_char(char):
+    category = unicodedata.category(char)
+    return category[0] in "LNM" or category == "Co"
+
+
+# Split text the way the FTS5 tokenizer does
+def query_terms(text):
+    return ["".join(chars) for is_token, chars in itertools.groupby(text, _is_token_char) if is_token]
+
+
+# Turn free text into an FTS5 query: every word is quoted (so user input
+# cannot inject operators), prefix-matched and OR-ed for BM25 ranking.
+def fts_query(text):
+    return " OR ".join('"{}"*'.format(word.replace('"', '""')) for word in query_terms(text))
+
+
+# Return [(kno, bm25)] best first; lower bm25 means more relevant
+def keyword_search(conn, text, limit=50):
+    query = fts_query(text)
+    if not query:
+        return []
+    with stage(KEYWORD_SEARCH, limit=limit):
+        return conn.execute(
+            "SELECT rowid, bm25(tirukkural_fts) AS score FROM tirukkural_fts WHERE tirukkural_fts MATCH ? ORDER BY score LIMIT ?",
+            (query, limit),
+        ).fetchall()
+
+
+# Fuse several best-first id lists with reciprocal-rank fusion
+def reciprocal_rank_fusion(rankings, k=60, weights=None):
+    fused = {}
+    for ranking, weight in zip(rankings, weights or [1.0] * len(rankings)):
+        for rank, kno in enumerate(ranking):
+            fused[kno] = fused.get(kno, 0.0) + weight / (k + rank + 1)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+# Rank kurals by BM25 keyword relevance and cosine similarity together.
+# Both candidate lists come from one indexed query and one matrix-vector
+# product, then are fused; returns [(kno, fused_score)] best first.
+def hybrid_search(conn, index, text, query_embedding=None, top_n=5, candidates=50, k=60, keyword_weight=1.0):
+    keyword_ids = [kno for kno, _ in keyword_search(conn, text, candidates)]
+    rankings, weights = [keyword_ids], [keyword_weight]
+    if query_embedding is not None:
+        vector_ids, _ = index.search(query_embedding, candidates)
+        rankings.append(vector_ids)
+        weights.append(1.0)
+    return reciprocal_rank_fusion(rankings, k, weights)[:top_n]
@@ -0,0 +1,221 @@
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from embedding_index import ensure_generation_counter
+
+
+# Casefold and collapse whitespace and trailing punctuation so trivially
+# different spellings of a question share one cache entry.
+def normalize_query(query):
+    query = re.sub(r"\s+", " ", query.casefold()).strip()
+    return query.rstrip("?!. ")
+
+
+class LRUCache:
+    """Thread-safe in-process LRU with a size bound and a time-to-live."""
+
+    def __init__(self, max_size=1024, ttl=3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            stored_at, value = item
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = (time.monotonic(), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+
+# Schema for the persistent cache. Results are tagged with the embeddings
+# generation (see embedding_index.ensure_generation_counter), so a change to
+# the embeddings column invalidates them.
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS query_cache (
+    query TEXT NOT NULL,
+    model TEXT NOT NULL,
+    embedding BLOB NOT NULL,
+    generation INTEGER,
+    top_n INTEGER,
+    result_ids TEXT,
+    result_scores TEXT,
+    created REAL NOT NULL,
+    PRIMARY KEY (query, model)
+);
+CREATE INDEX IF NOT EXISTS query_cache_created ON query_cache (created);
+"""
+
+
+class QueryCache:
+    """Two-level cache of query embeddings and their top-k kno results.
+
+    Lookups go to the in-process LRU first, then to the query_cache table in
+    the SQLite file, and only then to the embedding backend. Cached results
+    are reused only while the embeddings generation they were computed
+    against is current; the query vector itself stays valid per model.
+    Both levels expire entries after ttl seconds, and the table keeps at
+    most max_disk_entries of the newest rows.
+    """
+
+    def __init__(self, conn, backend, index, max_size=1024, ttl=3600, max_disk_entries=100000):
+        self.conn = conn
+        self.backend = backend
+        self.index = index
+        self.ttl = ttl
+        self.max_disk_entries = max_disk_entries
+        self.memory = LRUCache(max_size, ttl)
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "result_hits": 0, "result_misses": 0}
+        self._stats_lock = threading.Lock()
+        ensure_generation_counter(conn, index.table, index.column)
+        conn.executescript(CACHE_SCHEMA)
+        conn.commit()
+
+    def _count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def generation(self):
+        return self.conn.execute("SELECT generation FROM embedding_generation WHERE id = 1").fetchone()[0]
+
+    def _load(self, key, model):
+        oldest = time.time() - self.ttl if self.ttl is not None else 0
+        row = self.conn.execute(
+            "SELECT embedding, generation, top_n, result_ids, result_scores FROM query_cache "
+            "WHERE query = ? AND model = ? AND created >= ?",
+            (key, model, oldest),
+        ).fetchone()
+        if row is None:
+            return None
+        embedding, generation, top_n, result_ids, result_scores = row
+        entry = {"embedding": np.frombuffer(embedding, dtype=np.float32), "generation": generation, "top_n": top_n}
+        if result_ids is not None:
+            entry["ids"] = json.loads(result_ids)
+            entry["scores"] = json.loads(result_scores)
+        return entry
+
+    # Write entries to both levels; the disk writes share one transaction
+    def _store(self, model, entries):
+        rows = []
+        for key, entry in entries.items():
+            self.memory.put((key, model), entry)
+            rows.append((key, model, np.asarray(entry["embedding"], dtype=np.float32).tobytes(),
+                         entry.get("generation"), entry.get("top_n"),
+                         json.dumps(entry["ids"]) if "ids" in entry else None,
+                         json.dumps(entry["scores"]) if "scores" in entry else None,
+                         time.time()))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO query_cache (query, model, embedding, generation, top_n, result_ids, result_scores, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._prune()
+
+    # Drop expired rows and all but the newest max_disk_entries
+    def _prune(self):
+        if self.ttl is not None:
+            self.conn.execute("DELETE FROM query_cache WHERE created < ?", (time.time() - self.ttl,))
+        if self.max_disk_entries is not None:
+            self.conn.execute(
+                "DELETE FROM query_cache WHERE rowid IN "
+                "(SELECT rowid FROM query_cache ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                (self.max_disk_entries,),
+            )
+
+    def _cached(self, key, model):
+        entry = self.memory.get((key, model))
+        if entry is not None:
+            self._count("memory_hits")
+            return entry
+        entry = self._load(key, model)
+        if entry is not None:
+            self._count("disk_hits")
+            self.memory.put((key, model), entry)
+        return entry
+
+    # Resolve cache entries for several queries; every miss is embedded in
+    # a single backend call. Returns (keys, entries, fresh) in query order.
+    def _entries(self, queries):
+        model = self.backend.model
+        keys = [normalize_query(query) for query in queries]
+        entries, missing = {}, {}
+        for key, query in zip(keys, queries):
+            if key in entries or key in missing:
+                continue
+            entry = self._cached(key, model)
+            if entry is None:
+                self._count("misses")
+                missing[key] = query
+            else:
+                entries[key] = entry
+        if missing:
+            vectors = self.backend.embed(list(missing.values()))
+            for key, vector in zip(missing, vectors):
+                entries[key] = {"embedding": vector, "generation": None, "top_n": None}
+        return keys, entries, set(missing)
+
+    # Embedding for a query, from cache when possible
+    def embedding(self, query):
+        return self.embeddings([query])[0]
+
+    def embeddings(self, queries):
+        keys, entries, fresh = self._entries(queries)
+        if fresh:
+            self._store(self.backend.model, {key: entries[key] for key in fresh})
+        return [entries[key]["embedding"] for key in keys]
+
+    # Top-k (ids, scores) for a query, reusing cached results while the
+    # embeddings column is unchanged
+    def search(self, query, top_n=5):
+        return self.search_many([query], top_n)[0]
+
+    # Batched search: cache misses are embedded together and stale results
+    # are recomputed with one matrix product
+    def search_many(self, queries, top_n=5):
+        keys, entries, _ = self._entries(queries)
+        generation = self.generation()
+        stale = []
+        for key, entry in entries.items():
+            if entry["generation"] == generation and entry["top_n"] is not None and entry["top_n"] >= top_n:
+                self._count("result_hits")
+            else:
+                self._count("result_misses")
+                stale.append(key)
+
+        if stale:
+            results = self.index.search_many([entries[key]["embedding"] for key in stale], top_n)
+            for key, (ids, scores) in zip(stale, results):
+                entries[key] = {"embedding": entries[key]["embedding"], "generation": generation,
+                                "top_n": top_n, "ids": ids, "scores": scores}
+            self._store(self.backend.model, {key: entries[key] for key in stale})
+        return [(entries[key]["ids"][:top_n], entries[key]["scores"][:top_n]) for key in keys]
+
+    def clear(self):
+        self.memory.clear()
+        with self.conn:
+            self.conn.execute("DELETE FROM query_cache")
@@ -0,0 +1,250 @@
+import asyncio
+import json
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from chat_backends import build_prompt
+from embedding_index import EmbeddingIndex
+from embedding_snapshot import SnapshotIndex
+from instrumentation import LLM_CALL, ROW_FETCH, stage
+from query_cache import QueryCache
+
+
+class QueryBatcher:
+    """Coalesces concurrent searches into batched embedding and matrix calls.
+
+    One worker thread owns the index and cache connection; callers get a
+    Future back and block on it.
+    """
+
+    def __init__(self, cache, max_batch=32, max_wait=0.005):
+        self.cache = cache
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="query-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, query, top_n=5):
+        future = Future()
+        self._queue.put((query, top_n, future))
+        return future
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    # Collect up to max_batch items, waiting at most max_wait after the first
+    def _drain(self, first):
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._drain(first)
+            top_n = max(top_n for _, top_n, _ in batch)
+            try:
+                results = self.cache.search_many([query for query, _, _ in batch], top_n)
+            except Exception:
+                # Retry one by one so a bad query fails only its own request
+                results = [self._search_one(query, top_n) for query, _, _ in batch]
+            for (_, wanted, future), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    ids, scores = result
+                    future.set_result((ids[:wanted], scores[:wanted]))
+
+    def _search_one(self, query, top_n):
+        try:
+            return self.cache.search(query, top_n)
+        except Exception as exc:
+            return exc
+
+
+class RetrievalService:
+    """Warm retrieval + RAG state shared by every request of the server."""
+
+    def __init__(self, db_path, backend, chat, max_batch=32, max_wait=0.005, llm_concurrency=8, snapshot=None,
+                 read_connections=8):
+        self.db_path = db_path
+        self.backend = backend
+        self.chat = chat
+
+        # Bounded pool of read-only connections shared by the request
+        # threads; slots start empty and connect on first use
+        self._readers = queue.Queue(maxsize=read_connections)
+        for _ in range(read_connections):
+            self._readers.put(None)
+
+        # The batcher thread is the only user of this connection
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # With a snapshot, searches run off the shared memory map instead
+        # of a private copy of the matrix
+        self.index = SnapshotIndex(conn, snapshot) if snapshot else EmbeddingIndex(conn)
+        self.cache = QueryCache(conn, backend, self.index)
+        self.batcher = QueryBatcher(self.cache, max_batch, max_wait)
+
+        # LLM calls run on an event loop thread, at most llm_concurrency at once
+        self.loop = asyncio.new_event_loop()
+        self._llm_slots = None
+        self._llm_concurrency = llm_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=llm_concurrency, thread_name_prefix="llm")
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, name="llm-loop", daemon=True)
+        self._loop_thread.start()
+
+    def warm(self):
+        self.index.load()
+        return self
+
+    # Borrow a read-only connection for fetching kural rows. The server
+    # starts a thread per request, so connections are pooled rather than
+    # kept per thread; callers block while every connection is in use.
+    @contextmanager
+    def read_connection(self):
+        conn = self._readers.get()
+        try:
+            if conn is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                conn.execute("PRAGMA query_only = 1")
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def fetch_rows(self, ids):
+        if not ids:
+            return []
+        with stage(ROW_FETCH, rows=len(ids)), self.read_connection() as conn:
+            rows = conn.execute(
+                "SELECT kno, efirstline, esecondline, explanation FROM tirukkural WHERE kno IN ({})".format(','.join('?' * len(ids))),
+                ids,
+            ).fetchall()
+        rows_by_kno = {row[0]: row for row in rows}
+        return [rows_by_kno[kno] for kno in ids if kno in rows_by_kno]
+
+    def search(self, query, top_n=5):
+        ids, scores = self.batcher.submit(query, top_n).result()
+        # Rows deleted since the search are dropped, so match scores by kno
+        scores_by_kno = dict(zip(ids, scores))
+        return [
+            {"kno": kno, "efirstline": first, "esecondline": second, "explanation": explanation,
+             "score": scores_by_kno[kno]}
+            for kno, first, second, explanation in self.fetch_rows(ids)
+        ]
+
+    async def _complete(self, prompt):
+        if self._llm_slots is None:
+            self._llm_slots = asyncio.Semaphore(self._llm_concurrency)
+        async with self._llm_slots:
+            return await self.loop.run_in_executor(self._executor, self._timed_complete, prompt)
+
+    def _timed_complete(self, prompt):
+        with stage(LLM_CALL, model=self.chat.model):
+            return self.chat.complete(prompt)
+
+    def answer(self, query, top_n=5):
+        documents = self.search(query, top_n)
+        context = "\n".join(" ".join(str(doc[column]) for column in ("efirstline", "esecondline", "explanation"))
+                            for doc in documents)
+        prompt = build_prompt(query, context)
+        response = asyncio.run_coroutine_threadsafe(self._complete(prompt), self.loop).result()
+        return {"answer": response, "documents": documents}
+
+    # Request threads only read the row count of the last batch; the index
+    # itself stays with the batcher thread
+    def stats(self):
+        return {"rows": len(self.index.ids), "cache": dict(self.cache.stats)}
+
+    def close(self):
+        self.batcher.close()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+        self._executor.shutdown()
+        while not self._readers.empty():
+            conn = self._readers.get_nowait()
+            if conn is not None:
+                conn.close()
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, {"status": "ok", **service.stats()})
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            routes = {"/search": service.search, "/answer": service.answer}
+            if self.path not in routes:
+                self._send(404, {"error": "not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                query = request["query"]
+                top_n = int(request.get("top_n", 5))
+                if not isinstance(query, str):
+                    raise TypeError("query must be a string")
+                if top_n < 1:
+                    raise ValueError("top_n must be at least 1")
+            except (ValueError, KeyError, TypeError) as exc:
+                self._send(400, {"error": f"bad request: {exc}"})
+                return
+            try:
+                self._send(200, {"results": routes[self.path](query, top_n)})
+            except Exception as exc:
+                self._send(500, {"error": str(exc)})
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+class RetrievalServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 resets connections under bursts of
+    # concurrent clients
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def serve(service, host="127.0.0.1", port=8000):
+    server = RetrievalServer((host, port), make_handler(service))
+    print(f"Serving {len(service.index.ids)} embedded kurals on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
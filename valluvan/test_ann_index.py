@@ -0,0 +1,73 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from ann_index import TARGET_RECALL, IVFIndex, build_chunk_index, recall_benchmark, synthetic_chunks
+from bench_embedd import make_fixture
+from embedding_backends import StubBackend
+
+
+@pytest.fixture(scope="module")
+def chunks():
+    return synthetic_chunks(200, 10, 32)
+
+
+@pytest.fixture(scope="module")
+def index(chunks):
+    vectors, knos = chunks
+    return IVFIndex().add(vectors, knos)
+
+
+def noisy_queries(vectors, count=100, seed=1):
+    rng = np.random.default_rng(seed)
+    queries = vectors[rng.choice(len(vectors), count, replace=False)]
+    return queries + 0.3 * rng.standard_normal(queries.shape, dtype=np.float32)
+
+
+def test_build_chunk_index_keeps_the_given_index(tmp_path):
+    conn = sqlite3.connect(make_fixture(str(tmp_path / "fixture.sqlite"), rows=60, dim=16))
+    index = build_chunk_index(conn, StubBackend(dim=16), IVFIndex(7, n_probe=2), columns=("explanation",))
+    assert (index.n_lists, index.n_probe, len(index)) == (7, 2, 60)
+    assert build_chunk_index(conn, StubBackend(dim=16), columns=("explanation",)).n_lists == int(4 * np.sqrt(60))
+    conn.close()
+
+
+def test_probing_every_list_is_exact(index, chunks):
+    for query in noisy_queries(chunks[0], 10):
+        assert index.search(query, 10, index.n_lists) == pytest.approx(index.exact_search(query, 10))
+
+
+def test_results_are_one_per_kno(index, chunks):
+    knos, _ = index.search(chunks[0][0], 10)
+    assert len(knos) == len(set(knos)) == 10
+    assert knos[0] == chunks[1][0]
+
+
+def test_tuned_n_probe_reaches_target_on_unseen_queries(chunks):
+    vectors, knos = chunks
+    index = IVFIndex().add(vectors, knos)
+    tuned = index.tune()
+    assert 1 <= tuned < index.n_lists
+    report = recall_benchmark(index, noisy_queries(vectors, seed=7), 10, (tuned,))
+    assert report[-1]["recall"] >= TARGET_RECALL - 0.02
+
+
+def test_untuned_default_probes_a_third_of_the_lists(index):
+    assert IVFIndex(n_lists=90).default_n_probe() == 30
+    assert index.default_n_probe() == index.n_lists // 3
+
+
+def test_save_and_load_round_trip(index, chunks, tmp_path):
+    path = index.save(str(tmp_path / "index.npz"))
+    loaded = IVFIndex.load(path)
+    assert (loaded.n_lists, loaded.n_probe) == (index.n_lists, index.n_probe)
+    query = noisy_queries(chunks[0], 1)[0]
+    assert loaded.search(query, 5) == index.search(query, 5)
+
+
+def test_remove_drops_every_chunk_of_a_kno(chunks):
+    vectors, knos = chunks
+    index = IVFIndex().add(vectors, knos).remove([1, 2])
+    assert len(index) == len(knos) - 20
+    assert not {1, 2}.intersection(index.search(vectors[0], 10, index.n_lists)[0])
@@ -0,0 +1,29 @@
+import ast
+
+import pytest
+
+import embedd
+from bench_embedd import make_fixture
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = make_fixture(str(tmp_path / "fixture.sqlite"), rows=40, dim=16)
+    yield path
+    if embedd.conn is not None:
+        embedd.conn.close()
+        embedd.conn = None
+
+
+@pytest.mark.parametrize("mode", [[], ["--hybrid"]])
+def test_answer_is_built_from_the_rows_shown(db, capsys, monkeypatch, mode):
+    contexts = []
+    monkeypatch.setattr(embedd, "generate_response", lambda query, context: contexts.append(context) or "answer")
+    embedd.main(["--db", db, "--backend", "stub", "--backend-option", "dim=16", "--chat", "stub",
+                 "search", "love wisdom", "--top-n", "3", "--answer", *mode])
+    shown = capsys.readouterr().out.splitlines()[:3]
+    assert len(contexts) == 1
+    rows = contexts[0].splitlines()
+    assert len(rows) == len(shown) == 3
+    for line, row in zip(shown, rows):
+        assert all(str(value) in row for value in ast.literal_eval(line))
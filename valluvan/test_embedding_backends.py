@@ -0,0 +1,94 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from embedding_backends import OpenAIBackend, StubBackend, get_backend, is_transient, with_retries
+from instrumentation import EMBED_CALL, StatsSink, add_sink, remove_sink
+
+
+class HTTPError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.http_status = status
+
+
+def failing(errors):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return fn, calls
+
+
+@pytest.mark.parametrize("exc, expected", [
+    (TimeoutError(), True),
+    (ConnectionResetError(), True),
+    (HTTPError(429), True),
+    (HTTPError(503), True),
+    (HTTPError(400), False),
+    (HTTPError(401), False),
+    (ValueError("bad input"), False),
+])
+def test_is_transient(exc, expected):
+    assert is_transient(exc) is expected
+
+
+def test_with_retries_retries_transient_errors():
+    fn, calls = failing([TimeoutError(), HTTPError(502)])
+    assert with_retries(fn, max_retries=3, backoff=0) == "ok"
+    assert len(calls) == 3
+
+
+def test_with_retries_gives_up_after_max_retries():
+    fn, calls = failing([TimeoutError()] * 5)
+    with pytest.raises(TimeoutError):
+        with_retries(fn, max_retries=2, backoff=0)
+    assert len(calls) == 3
+
+
+def test_with_retries_raises_permanent_errors_at_once():
+    fn, calls = failing([HTTPError(400)])
+    with pytest.raises(HTTPError):
+        with_retries(fn, max_retries=3, backoff=0)
+    assert len(calls) == 1
+
+
+class FakeOpenAI(OpenAIBackend):
+    """OpenAIBackend with the HTTP call replaced by a slow local one."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = set()
+
+    def embed_batch(self, texts):
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return np.array([[float(text)] for text in texts], dtype=np.float64)
+
+
+def test_openai_batches_run_concurrently_and_keep_order():
+    backend = FakeOpenAI(batch_size=3, max_workers=4)
+    sink = add_sink(StatsSink())
+    try:
+        vectors = backend.embed(str(i) for i in range(20))
+    finally:
+        remove_sink(sink)
+    assert vectors.dtype == np.float32
+    assert vectors[:, 0].tolist() == list(range(20))
+    assert len(backend.threads) > 1
+    assert sink.stats[EMBED_CALL]["count"] == 1
+    assert backend.embed([]).shape == (0, 0)
+
+
+def test_stub_backend_is_deterministic():
+    backend = get_backend("stub", dim=8)
+    assert isinstance(backend, StubBackend)
+    first = backend.embed(["love", "rain"])
+    assert first.shape == (2, 8)
+    assert np.array_equal(first, StubBackend(dim=8).embed(["love", "rain"]))
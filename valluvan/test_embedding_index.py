@@ -0,0 +1,76 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from bench_embedd import make_fixture
+from embedding_index import EmbeddingIndex, normalize_rows, top_k
+
+
+@pytest.fixture
+def index(tmp_path):
+    path = make_fixture(str(tmp_path / "fixture.sqlite"), rows=120, dim=16)
+    conn = sqlite3.connect(path)
+    yield EmbeddingIndex(conn).load()
+    conn.close()
+
+
+def brute_force(scores, k):
+    return np.argsort(-scores, axis=-1, kind="stable")[..., :k]
+
+
+@pytest.mark.parametrize("k", [1, 5, 40, 60])
+def test_top_k_matches_brute_force(k):
+    scores = np.random.default_rng(0).standard_normal((7, 40)).astype(np.float32)
+    expected = brute_force(scores, k)
+    assert np.array_equal(top_k(scores[0], k), expected[0])
+    assert np.array_equal(top_k(scores, k), expected)
+
+
+def test_top_k_leaves_scores_alone_unless_asked():
+    scores = np.array([0.1, 0.9, 0.5], dtype=np.float32)
+    top_k(scores, 2)
+    assert scores.tolist() == pytest.approx([0.1, 0.9, 0.5])
+
+
+def test_search_matches_brute_force(index):
+    query = np.random.default_rng(1).standard_normal(16).astype(np.float32)
+    scores = normalize_rows(index.matrix.copy()) @ (query / np.linalg.norm(query))
+    ids, found = index.search(query, 5)
+    assert ids == index.ids[brute_force(scores, 5)].tolist()
+    assert found == pytest.approx(np.sort(scores)[::-1][:5].tolist(), rel=1e-5)
+    assert index.search_many([query], 5)[0][0] == ids
+
+
+def test_index_reloads_after_embeddings_change(index):
+    vector = np.zeros(16, dtype=np.float32)
+    vector[0] = 1.0
+    with index.conn:
+        index.conn.execute("UPDATE tirukkural SET embeddings = ? WHERE kno = 7", (vector.tobytes(),))
+    assert index.search(vector, 1) == ([7], [pytest.approx(1.0)])
+
+
+def test_all_pairs_matches_brute_force(index):
+    scores = index.matrix @ index.matrix.T
+    np.fill_diagonal(scores, -np.inf)
+    expected = brute_force(scores, 5)
+
+    # A tiny budget forces many blocks
+    blocks = list(index.all_pairs(5, memory_budget=12 * len(index) * 7))
+    assert len(blocks) > 1
+    ids = np.concatenate([block[0] for block in blocks])
+    neighbours = np.concatenate([block[1] for block in blocks])
+    neighbour_scores = np.concatenate([block[2] for block in blocks])
+    assert np.array_equal(ids, index.ids)
+    assert np.array_equal(neighbours, index.ids[expected])
+    assert np.allclose(neighbour_scores, np.take_along_axis(scores, expected, axis=1))
+    assert index.related_many(index.ids[:3], 5) == index.ids[expected[:3]].tolist()
+
+
+@pytest.mark.parametrize("k", [1, 5, 40])
+def test_top_k_can_negate_in_place(k):
+    scores = np.random.default_rng(0).standard_normal((7, 40)).astype(np.float32)
+    expected = brute_force(scores, k)
+    block = scores.copy()
+    assert np.array_equal(top_k(block, k, overwrite=True), expected)
+    assert np.array_equal(block, -scores)
@@ -0,0 +1,60 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from bench_embedd import make_fixture
+from embedding_backends import StubBackend
+from embedding_pipeline import load_checkpoint, update_embeddings
+
+
+class FlakyBackend(StubBackend):
+    """Stub backend that fails on its nth embed call."""
+
+    def __init__(self, fail_on, **kwargs):
+        super().__init__(**kwargs)
+        self.fail_on = fail_on
+        self.calls = 0
+
+    def embed(self, texts):
+        self.calls += 1
+        if self.calls == self.fail_on:
+            raise ConnectionError("embedding service went away")
+        return super().embed(texts)
+
+
+def embeddings(conn):
+    return [np.frombuffer(blob, dtype=np.float32) for _, blob in
+            conn.execute("SELECT kno, embeddings FROM tirukkural ORDER BY kno")]
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(make_fixture(str(tmp_path / "fixture.sqlite"), rows=50, dim=8))
+    yield conn
+    conn.close()
+
+
+def test_interrupted_run_resumes_from_checkpoint(conn, tmp_path):
+    backend = FlakyBackend(fail_on=3, dim=8)
+    with pytest.raises(ConnectionError):
+        update_embeddings(conn, backend, page_size=10)
+    assert load_checkpoint(conn, backend.model) == 20
+
+    assert update_embeddings(conn, StubBackend(dim=8), page_size=10) == 30
+    assert load_checkpoint(conn, backend.model) == 0
+
+    clean = sqlite3.connect(make_fixture(str(tmp_path / "clean.sqlite"), rows=50, dim=8))
+    assert update_embeddings(clean, StubBackend(dim=8), page_size=10) == 50
+    assert all(np.array_equal(a, b) for a, b in zip(embeddings(conn), embeddings(clean)))
+    clean.close()
+
+
+def test_only_edited_rows_are_reembedded(conn):
+    backend = StubBackend(dim=8)
+    update_embeddings(conn, backend, page_size=10)
+    with conn:
+        conn.execute("UPDATE tirukkural SET explanation = 'rewritten' WHERE kno IN (4, 44)")
+    assert update_embeddings(conn, backend, page_size=10) == 2
+    assert update_embeddings(conn, backend, page_size=10) == 0
+    assert update_embeddings(conn, StubBackend(dim=8, model="other"), page_size=10) == 50
@@ -0,0 +1,77 @@
+import os
+import sqlite3
+
+import numpy as np
+import pytest
+
+from bench_embedd import make_fixture
+from embedding_index import EmbeddingIndex
+from embedding_snapshot import EmbeddingSnapshot, SnapshotIndex, decode_blobs, export_snapshot
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(make_fixture(str(tmp_path / "fixture.sqlite"), rows=80, dim=32))
+    yield conn
+    conn.close()
+
+
+def test_decode_blobs():
+    rows = np.arange(6, dtype=np.float32).reshape(2, 3)
+    assert np.array_equal(decode_blobs(row.tobytes() for row in rows), rows)
+    assert decode_blobs([]).shape == (0, 0)
+
+
+@pytest.mark.parametrize("dtype, tolerance", [("float32", 1e-7), ("float16", 1e-3), ("int8", 1e-2)])
+def test_snapshot_dequantises_to_float32(conn, tmp_path, dtype, tolerance):
+    index = EmbeddingIndex(conn).load()
+    snapshot = EmbeddingSnapshot(export_snapshot(conn, str(tmp_path / "e.snap"), dtype))
+    try:
+        assert snapshot.dtype == dtype
+        assert snapshot.ids.tolist() == index.ids.tolist()
+        matrix = snapshot.matrix()
+        assert matrix.dtype == np.float32
+        assert np.abs(matrix - index.matrix).max() < tolerance
+        assert np.allclose(snapshot.vector(index.ids[3]), matrix[3])
+
+        query = index.matrix[5]
+        ids, _ = snapshot.search(query, 3)
+        assert ids[0] == index.ids[5]
+        assert snapshot.search_many([query], 3)[0][0] == ids
+    finally:
+        snapshot.close()
+
+
+def test_stale_snapshot_falls_back_to_database(conn, tmp_path):
+    path = export_snapshot(conn, str(tmp_path / "e.snap"), "int8")
+    index = SnapshotIndex(conn, path)
+    assert isinstance(index.current(), EmbeddingSnapshot)
+
+    with conn:
+        conn.execute("UPDATE tirukkural SET embeddings = ? WHERE kno = 1",
+                     (np.ones(32, dtype=np.float32).tobytes(),))
+    assert not index.snapshot.is_current(conn)
+    assert isinstance(index.current(), EmbeddingIndex)
+    assert index.search(np.ones(32), 1)[0] == [1]
+
+    export_snapshot(conn, path, "int8")
+    assert isinstance(index.current(), EmbeddingSnapshot)
+    assert index.search(np.ones(32), 1)[0] == [1]
+    index.close()
+
+
+def test_reexport_keeps_views_of_the_old_snapshot_valid(conn, tmp_path):
+    path = export_snapshot(conn, str(tmp_path / "e.snap"), "float16")
+    index = SnapshotIndex(conn, path).load()
+    held = index.ids
+    old = index.snapshot
+
+    with conn:
+        conn.execute("UPDATE tirukkural SET embeddings = ? WHERE kno = 2",
+                     (np.ones(32, dtype=np.float32).tobytes(),))
+    os.remove(path)
+    export_snapshot(conn, path, "float16")
+
+    assert index.search(np.ones(32), 1)[0] == [2]
+    assert index.snapshot is not old
+    assert held.tolist() == index.ids.tolist()
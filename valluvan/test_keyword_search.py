@@ -0,0 +1,44 @@
+import sqlite3
+
+from keyword_search import ensure_fts_index, fts_query, keyword_search, query_terms
+
+
+def make_db():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE tirukkural (kno INTEGER PRIMARY KEY, firstline TEXT, efirstline TEXT)")
+    conn.executemany("INSERT INTO tirukkural VALUES (?, ?, ?)", [
+        (1, "அகர முதல எழுத்தெல்லாம் ஆதி", "A, as its first of letters"),
+        (2, "அன்பின் வழியது உயிர்நிலை", "The body with love"),
+        (71, "அன்பிற்கும் உண்டோ அடைக்குந்தாழ்", "Is there any bolt to shut up love?"),
+    ])
+    ensure_fts_index(conn)
+    return conn
+
+
+def test_query_terms_keep_tamil_vowel_signs():
+    assert query_terms("அன்புடைமை") == ["அன்புடைமை"]
+    assert query_terms("அகர முதல, எழுத்து!") == ["அகர", "முதல", "எழுத்து"]
+
+
+def test_fts_query_quotes_operators():
+    assert fts_query('love "OR" NEAR(x') == '"love"* OR "OR"* OR "NEAR"* OR "x"*'
+    assert fts_query("?!") == ""
+
+
+def test_tamil_query_matches_whole_words_only():
+    conn = make_db()
+    assert keyword_search(conn, "அன்புடைமை") == []
+    assert [kno for kno, _ in keyword_search(conn, "அகர")] == [1]
+    assert sorted(kno for kno, _ in keyword_search(conn, "அன்பி")) == [2, 71]
+
+
+def test_triggers_follow_updates_and_deletes():
+    conn = make_db()
+    with conn:
+        conn.execute("UPDATE tirukkural SET efirstline = 'Wealth of grace' WHERE kno = 2")
+        conn.execute("DELETE FROM tirukkural WHERE kno = 71")
+        conn.execute("INSERT INTO tirukkural VALUES (72, 'அன்புடையார்', 'Loveless people')")
+    assert [kno for kno, _ in keyword_search(conn, "love")] == [72]
+    assert [kno for kno, _ in keyword_search(conn, "grace")] == [2]
+    assert [kno for kno, _ in keyword_search(conn, "அன்பி")] == [2]
+    assert [kno for kno, _ in keyword_search(conn, "அன்புடை")] == [72]
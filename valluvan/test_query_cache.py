@@ -0,0 +1,74 @@
+import sqlite3
+import time
+
+import numpy as np
+import pytest
+
+from bench_embedd import make_fixture
+from embedding_backends import StubBackend
+from embedding_index import EmbeddingIndex
+from query_cache import QueryCache, normalize_query
+
+
+@pytest.fixture
+def cache(tmp_path):
+    path = make_fixture(str(tmp_path / "fixture.sqlite"), rows=60, dim=16)
+    conn = sqlite3.connect(path)
+    yield QueryCache(conn, StubBackend(dim=16), EmbeddingIndex(conn))
+    conn.close()
+
+
+def test_normalize_query():
+    assert normalize_query("  What is  LOVE?? ") == "what is love"
+
+
+def test_results_are_reused_until_embeddings_change(cache):
+    ids, _ = cache.search("What is love?", 3)
+    assert cache.search("what is love", 3)[0] == ids
+    assert cache.stats["result_hits"] == 1
+    assert cache.stats["misses"] == 1
+
+    # Cache writes alone must not invalidate the resident index
+    version = cache.index._version
+    cache.search("rain", 3)
+    assert cache.index._current_version() == version
+
+    # Make another kural the exact best match for the query
+    target = next(kno for kno in cache.index.ids.tolist() if kno not in ids)
+    vector = cache.embedding("What is love?")
+    with cache.conn:
+        cache.conn.execute("UPDATE tirukkural SET embeddings = ? WHERE kno = ?",
+                           (np.asarray(vector, dtype=np.float32).tobytes(), target))
+
+    new_ids, scores = cache.search("What is love?", 3)
+    assert new_ids[0] == target
+    assert scores[0] == pytest.approx(1.0)
+    assert cache.stats["result_misses"] == 3
+    # The query embedding itself stays cached
+    assert cache.stats["misses"] == 2
+
+
+def test_disk_cache_survives_a_new_process(cache):
+    ids, _ = cache.search("wisdom", 3)
+    fresh = QueryCache(cache.conn, cache.backend, cache.index)
+    assert fresh.search("wisdom", 3)[0] == ids
+    assert fresh.stats["disk_hits"] == 1
+    assert fresh.stats["result_hits"] == 1
+
+
+def test_expired_entries_are_not_reloaded_from_disk(cache):
+    cache = QueryCache(cache.conn, cache.backend, cache.index, ttl=0.01)
+    cache.search("patience", 3)
+    time.sleep(0.05)
+    cache.search("patience", 3)
+    assert cache.stats["disk_hits"] == 0
+    assert cache.stats["misses"] == 2
+
+
+def test_disk_cache_is_capped(cache):
+    cache = QueryCache(cache.conn, cache.backend, cache.index, max_disk_entries=5)
+    cache.search_many([f"question {i}" for i in range(12)], 3)
+    cache.search("one more", 3)
+    count = cache.conn.execute("SELECT COUNT(*) FROM query_cache").fetchone()[0]
+    assert count == 5
+    assert cache._load("one more", cache.backend.model) is not None
@@ -0,0 +1,139 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from bench_embedd import make_fixture
+from chat_backends import StubChat
+from embedding_backends import StubBackend
+from rag_service import QueryBatcher, RetrievalServer, RetrievalService, make_handler
+
+
+class RecordingCache:
+    """Stands in for QueryCache: records each batch and echoes the queries."""
+
+    def __init__(self, fail_on=()):
+        self.batches = []
+        self.fail_on = set(fail_on)
+
+    def search_many(self, queries, top_n=5):
+        self.batches.append(list(queries))
+        bad = self.fail_on.intersection(queries)
+        if bad:
+            raise ValueError(f"cannot search {sorted(bad)}")
+        return [([query] * top_n, [1.0] * top_n) for query in queries]
+
+    def search(self, query, top_n=5):
+        return self.search_many([query], top_n)[0]
+
+
+def test_batch_wait_is_bounded_from_the_first_request():
+    cache = RecordingCache()
+    batcher = QueryBatcher(cache, max_batch=1000, max_wait=0.05)
+    stop = threading.Event()
+
+    # A steady trickle, each request well inside max_wait of the last
+    def trickle():
+        i = 0
+        while not stop.is_set():
+            batcher.submit(f"q{i}")
+            i += 1
+            time.sleep(0.005)
+
+    thread = threading.Thread(target=trickle)
+    started = time.monotonic()
+    first = batcher.submit("first")
+    thread.start()
+    try:
+        first.result(timeout=2)
+        assert time.monotonic() - started < 2 * batcher.max_wait
+    finally:
+        stop.set()
+        thread.join()
+        batcher.close()
+
+
+def test_results_are_trimmed_per_request():
+    batcher = QueryBatcher(RecordingCache(), max_wait=0.05)
+    try:
+        small, large = batcher.submit("a", 1), batcher.submit("b", 3)
+        assert small.result(timeout=2) == (["a"], [1.0])
+        assert large.result(timeout=2) == (["b"] * 3, [1.0] * 3)
+    finally:
+        batcher.close()
+
+
+def test_one_bad_query_fails_only_its_own_request():
+    cache = RecordingCache(fail_on=["bad"])
+    batcher = QueryBatcher(cache, max_wait=0.05)
+    try:
+        futures = [batcher.submit(query, 2) for query in ("a", "bad", "b")]
+        assert futures[0].result(timeout=2) == (["a", "a"], [1.0, 1.0])
+        with pytest.raises(ValueError):
+            futures[1].result(timeout=2)
+        assert futures[2].result(timeout=2) == (["b", "b"], [1.0, 1.0])
+        assert cache.batches[0] == ["a", "bad", "b"]
+    finally:
+        batcher.close()
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    path = make_fixture(str(tmp_path_factory.mktemp("rag") / "fixture.sqlite"), rows=50, dim=16)
+    service = RetrievalService(path, StubBackend(dim=16), StubChat(), read_connections=2).warm()
+    server = RetrievalServer(("127.0.0.1", 0), make_handler(service))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", service
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def post(url, payload):
+    request = urllib.request.Request(url, json.dumps(payload).encode(), {"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.load(exc)
+
+
+@pytest.mark.parametrize("payload", [{"query": 5}, {"query": "love", "top_n": 0}, {"top_n": 3}, {"query": "x", "top_n": "many"}])
+def test_invalid_requests_are_rejected(server, payload):
+    url, _ = server
+    status, body = post(url + "/search", payload)
+    assert status == 400
+    assert "error" in body
+
+
+def test_search_and_answer(server):
+    url, service = server
+    status, body = post(url + "/search", {"query": "What is love?", "top_n": 3})
+    assert status == 200
+    results = body["results"]
+    assert len(results) == 3
+    assert [row["score"] for row in results] == sorted((row["score"] for row in results), reverse=True)
+
+    status, body = post(url + "/answer", {"query": "What is love?", "top_n": 2})
+    assert status == 200
+    assert body["results"]["answer"]
+    assert len(body["results"]["documents"]) == 2
+
+    with urllib.request.urlopen(url + "/health") as response:
+        assert json.load(response)["rows"] == 50
+    assert post(url + "/nowhere", {"query": "x"})[0] == 404
+
+
+def test_scores_stay_with_their_rows_when_a_row_disappears(server, monkeypatch):
+    url, service = server
+    ids, scores = service.batcher.submit("Rain and wealth", 4).result()
+    fetch_rows = service.fetch_rows
+    monkeypatch.setattr(service, "fetch_rows", lambda wanted: [row for row in fetch_rows(wanted) if row[0] != ids[1]])
+    results = service.search("Rain and wealth", 4)
+    expected = dict(zip(ids, scores))
+    del expected[ids[1]]
+    assert {row["kno"]: row["score"] for row in results} == expected